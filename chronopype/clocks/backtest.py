@@ -1,6 +1,8 @@
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from fractions import Fraction
+from itertools import batched, chain
 
 from chronopype.clocks.base import BaseClock
 from chronopype.clocks.config import FLOAT_EPSILON, ClockConfig
@@ -11,6 +13,53 @@ from chronopype.processors.base import TickProcessor
 logger = logging.getLogger(__name__)
 
 
+_TICK_SCALE: int = 1_000_000_000
+"""Fixed-precision scale (nanoseconds per second) for backtest tick arithmetic."""
+
+
+def _to_ns(seconds: float) -> int:
+    """Convert a float number of seconds to the nearest integer nanosecond.
+
+    The conversion goes through the exact rational value of the float. A
+    float multiplication would round epoch-scale timestamps, whose
+    nanosecond values exceed 2**53, by up to 128ns.
+    """
+    return round(Fraction(seconds) * _TICK_SCALE)
+
+
+def _tick_grid(current_ns: int, tick_ns: int, num_ticks: int) -> range:
+    """Return the nanosecond times of the ``num_ticks`` ticks after ``current_ns``.
+
+    Every tick time is an exact integer, so no error accumulates across ticks.
+    The range is lazy, so long runs use constant memory.
+    """
+    return range(current_ns + tick_ns, current_ns + num_ticks * tick_ns + 1, tick_ns)
+
+
+def _tick_count(current_ns: int, target_ns: int, tick_ns: int) -> int:
+    """Compute the number of ticks that advance ``current_ns`` to ``target_ns``.
+
+    A partial final tick is counted when at least one whole tick fits in the
+    span.
+    """
+    num_ticks, remainder = divmod(target_ns - current_ns, tick_ns)
+    if num_ticks <= 0:
+        return 0
+    return num_ticks + 1 if remainder else num_ticks
+
+
+def _tick_timestamps(current_ns: int, target_ns: int, tick_ns: int) -> Iterator[int]:
+    """Yield the nanosecond times of the ticks from ``current_ns`` to ``target_ns``.
+
+    When the span is not a whole number of ticks, a final tick aligned to
+    ``target_ns`` is added; the last tick always lands on ``target_ns``.
+    """
+    num_ticks = _tick_count(current_ns, target_ns, tick_ns)
+    if num_ticks <= 0:
+        return iter(())
+    return chain(_tick_grid(current_ns, tick_ns, num_ticks - 1), (target_ns,))
+
+
 class BacktestClock(BaseClock):
     """Clock implementation for backtesting mode."""
 
@@ -29,6 +78,22 @@ class BacktestClock(BaseClock):
         if config.end_time <= 0:
             raise ClockError("end_time must be set for backtest mode")
         super().__init__(config, error_callback)
+        self._tick_ns = max(1, _to_ns(config.tick_size))
+        # Exact integer position of the current tick, and the timestamp it was
+        # derived for; ticks advance the integer so no rounding accumulates
+        self._current_ns = _to_ns(self._current_tick)
+        self._current_ns_tick = self._current_tick
+
+    def _position_ns(self) -> int:
+        """Get the exact integer nanosecond position of the current tick.
+
+        The position is re-derived only when the timestamp was set from
+        outside the tick loop, such as on entering the context.
+        """
+        if self._current_tick != self._current_ns_tick:
+            self._current_ns = _to_ns(self._current_tick)
+            self._current_ns_tick = self._current_tick
+        return self._current_ns
 
     async def run(self) -> None:
         """Run the clock until end_time."""
@@ -36,42 +101,57 @@ class BacktestClock(BaseClock):
 
     async def run_til(self, target_time: float) -> None:
         """Run the clock until the target time."""
+        await self._validate_and_start(
+            target_time,
+            context_error="Clock must be started in a context",
+            end_time_error="Cannot run past end_time in backtest mode",
+        )
+
+    async def _validate_and_start(
+        self, target_time: float, *, context_error: str, end_time_error: str
+    ) -> None:
+        """Check that the clock can run to the target time, then run it.
+
+        Shared by run_til() and fast_forward() so a run is validated once.
+        """
         if self._task is not None:
             raise ClockError("Clock is already running")
 
-        if self._current_context is None:
-            raise ClockError("Clock must be started in a context")
+        context = self._current_context
+        if context is None:
+            raise ClockError(context_error)
 
         if target_time > self._config.end_time:
-            raise ClockError("Cannot run past end_time in backtest mode")
+            raise ClockError(end_time_error)
+
+        await self._start_run(context, target_time)
 
+    async def _start_run(
+        self, context: list[TickProcessor], target_time: float
+    ) -> None:
+        """Activate the context's processors and run until the target time.
+
+        Callers validate the run first through _validate_and_start().
+        """
         self._running = True
         self._started = True
-        self._task = asyncio.create_task(
-            self._run_til_impl(target_time, self._current_context)
-        )
+        self._task = asyncio.create_task(self._run_til_impl(target_time))
 
-        # Activate all processors
-        for processor in self._current_context:
-            state = self._processor_states[processor]
-            self._processor_states[processor] = state.model_copy(
-                update={"is_active": True}
-            )
+        self._activate_processors(context)
 
         try:
             await self._task
         finally:
             self._task = None
 
-    async def _run_til_impl(
-        self, target_time: float, processors: list[TickProcessor]
-    ) -> None:
+    async def _run_til_impl(self, target_time: float) -> None:
         """Run the clock until a specific timestamp."""
         if not self._running:
             raise ClockError("Clock must be started in a context.")
 
-        # Calculate number of ticks needed
-        num_ticks = int((target_time - self._current_tick) / self._config.tick_size)
+        current_ns = self._position_ns()
+        target_ns = _to_ns(target_time)
+        num_ticks = _tick_count(current_ns, target_ns, self._tick_ns)
         if num_ticks <= 0:
             return
 
@@ -81,20 +161,23 @@ class BacktestClock(BaseClock):
             self._current_tick,
             target_time,
         )
+        timestamps = _tick_timestamps(current_ns, target_ns, self._tick_ns)
 
-        # Execute ticks
-        for _ in range(num_ticks):
-            self._current_tick += self._config.tick_size
-            processors = [p for p in processors if self._processor_states[p].is_active]
-            await self._execute_tick(processors)
+        # Execute ticks in batches, yielding to the event loop between batches
+        for batch in batched(timestamps, self._config.tick_batch_size, strict=False):
+            await self._execute_tick_batch(batch)
 
-        # Set final timestamp to exactly match target_time
-        if (
-            abs(self._current_tick - target_time) > FLOAT_EPSILON
-        ):  # Handle floating point precision
-            self._current_tick = target_time
-            processors = [p for p in processors if self._processor_states[p].is_active]
-            await self._execute_tick(processors)
+    async def _execute_ticks(self, timestamps: Iterable[int]) -> None:
+        """Execute one tick per nanosecond timestamp."""
+        for timestamp_ns in timestamps:
+            self._current_ns = timestamp_ns
+            self._current_tick = self._current_ns_tick = timestamp_ns / _TICK_SCALE
+            await self._execute_tick()
+
+    async def _execute_tick_batch(self, timestamps: Sequence[int]) -> None:
+        """Execute one tick per timestamp, then yield to the event loop once."""
+        await self._execute_ticks(timestamps)
+        await asyncio.sleep(0)
 
     async def step(self, n: int = 1) -> float:
         """Advance the clock by exactly n ticks.
@@ -119,17 +202,11 @@ class BacktestClock(BaseClock):
         if n < 1:
             raise ClockError("Number of ticks must be at least 1")
 
-        target_tick = self._current_tick + n * self._config.tick_size
-        if target_tick > self._config.end_time + FLOAT_EPSILON:
+        current_ns = self._position_ns()
+        if current_ns + n * self._tick_ns > _to_ns(self._config.end_time):
             raise ClockError("Cannot step past end_time")
 
-        for _ in range(n):
-            self._current_tick += self._config.tick_size
-            processors = [
-                p for p in self._current_context if self._processor_states[p].is_active
-            ]
-            await self._execute_tick(processors)
-
+        await self._execute_ticks(_tick_grid(current_ns, self._tick_ns, n))
         return self._current_tick
 
     async def step_to(self, target_time: float) -> float:
@@ -155,37 +232,18 @@ class BacktestClock(BaseClock):
         if target_time > self._config.end_time + FLOAT_EPSILON:
             raise ClockError("Cannot step past end_time")
 
-        num_ticks = int((target_time - self._current_tick) / self._config.tick_size)
-        if num_ticks <= 0:
-            return self._current_tick
-
-        for _ in range(num_ticks):
-            self._current_tick += self._config.tick_size
-            processors = [
-                p for p in self._current_context if self._processor_states[p].is_active
-            ]
-            await self._execute_tick(processors)
-
-        # Handle floating-point remainder: align to target_time if needed
-        if abs(self._current_tick - target_time) > FLOAT_EPSILON:
-            self._current_tick = target_time
-            processors = [
-                p for p in self._current_context if self._processor_states[p].is_active
-            ]
-            await self._execute_tick(processors)
-
+        await self._execute_ticks(
+            _tick_timestamps(self._position_ns(), _to_ns(target_time), self._tick_ns)
+        )
         return self._current_tick
 
     async def fast_forward(self, seconds: float) -> None:
         """Fast forward the clock by a specified number of seconds."""
-        if self._current_context is None:
-            raise ClockError("Fast forward can only be used within a context")
-
-        if seconds <= 0:
+        if seconds <= 0 and self._current_context is not None:
             return
 
-        target_time = self._current_tick + seconds
-        if target_time > self._config.end_time:
-            raise ClockError("Cannot fast forward past end_time in backtest mode")
-
-        await self.run_til(target_time)
+        await self._validate_and_start(
+            self._current_tick + seconds,
+            context_error="Fast forward can only be used within a context",
+            end_time_error="Cannot fast forward past end_time in backtest mode",
+        )
@@ -19,6 +19,16 @@ from chronopype.processors.models import ProcessorState
 logger = logging.getLogger(__name__)
 
 
+def _is_sync_processor(processor: TickProcessor) -> bool:
+    """Whether a processor only implements the synchronous ``tick``.
+
+    True when ``async_tick`` is the default implementation that calls ``tick``
+    without ever suspending, so the clock may call ``tick`` directly.
+    """
+    async_tick = getattr(processor.async_tick, "__func__", None)
+    return async_tick is TickProcessor.async_tick
+
+
 @dataclass
 class ClockStartEvent:
     """Event emitted when the clock starts."""
@@ -103,6 +113,7 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
         )
 
         self._config = config
+        self._tick_size = config.tick_size
         self._tick_counter = 0
         self._current_tick = (
             config.start_time
@@ -112,6 +123,14 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
         self._processors: list[TickProcessor] = []
         self._processor_states: dict[TickProcessor, ProcessorState] = {}
         self._current_context: list[TickProcessor] | None = None
+        # Active processors of the current context, their states and whether
+        # they only implement the sync tick, aligned by index and rebuilt
+        # whenever a processor is added, removed, activated or deactivated
+        self._active_processors: list[TickProcessor] = []
+        self._active_states: list[ProcessorState] = []
+        self._active_sync: list[bool] = []
+        # Processors only implementing the sync tick, detected when added
+        self._sync_processors: set[TickProcessor] = set()
         self._started = False
         self._running = False
         self._task: asyncio.Task[None] | None = None
@@ -165,8 +184,12 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
 
     @property
     def processor_states(self) -> dict[TickProcessor, ProcessorState]:
-        """Get the current states of all processors."""
-        return self._processor_states.copy()
+        """Get a deep copy of the current states of all processors.
+
+        The clock mutates the states it owns in place, so the returned
+        copies are detached from later ticks.
+        """
+        return {p: s.model_copy(deep=True) for p, s in self._processor_states.items()}
 
     def get_processor_performance(
         self, processor: TickProcessor
@@ -234,15 +257,12 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
             try:
                 processor.stop()
                 state = self._processor_states[processor]
-                self._processor_states[processor] = state.model_copy(
-                    update={
-                        "is_active": False,
-                        "retry_count": 0,
-                        "consecutive_errors": 0,
-                    }
-                )
+                state.is_active = False
+                state.retry_count = 0
+                state.consecutive_errors = 0
             except Exception:
                 pass  # Best-effort cleanup
+        self._refresh_active_processors()
 
         for processor in self._current_context:
             if hasattr(processor, "await_cleanup"):
@@ -293,9 +313,13 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
                 self._processor_states.pop(processor)
                 raise ClockError(f"Failed to start processor: {str(e)}") from e
 
+        if _is_sync_processor(processor):
+            self._sync_processors.add(processor)
+
         # Add to current context so the processor gets ticked
         if self._current_context is not None and processor not in self._current_context:
             self._current_context.append(processor)
+        self._refresh_active_processors()
 
     def remove_processor(self, processor: TickProcessor) -> None:
         """Remove a processor from the clock and release ownership."""
@@ -312,16 +336,20 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
                 # Still remove the processor but propagate the error
                 self._processors.remove(processor)
                 self._processor_states.pop(processor, None)
+                self._sync_processors.discard(processor)
                 processor._owner_clock = None
+                self._refresh_active_processors()
                 raise ClockError(f"Failed to stop processor: {str(e)}") from e
 
         self._processors.remove(processor)
         self._processor_states.pop(processor, None)
+        self._sync_processors.discard(processor)
         processor._owner_clock = None
 
         # Remove from current context so the processor is no longer ticked
         if self._current_context is not None and processor in self._current_context:
             self._current_context.remove(processor)
+        self._refresh_active_processors()
 
     def pause_processor(self, processor: TickProcessor) -> None:
         """Pause a processor.
@@ -336,9 +364,8 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
         state = self._processor_states[processor]
         if state.is_active:
             processor.pause()
-            self._processor_states[processor] = state.model_copy(
-                update={"is_active": False}
-            )
+            state.is_active = False
+            self._refresh_active_processors()
 
     def resume_processor(self, processor: TickProcessor) -> None:
         """Resume a paused processor.
@@ -351,9 +378,8 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
 
         state = self._processor_states[processor]
         if not state.is_active:
-            self._processor_states[processor] = state.model_copy(
-                update={"is_active": True}
-            )
+            state.is_active = True
+            self._refresh_active_processors()
             processor.resume()
 
     def get_processor_state(self, processor: TickProcessor) -> ProcessorState | None:
@@ -364,169 +390,273 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
         """Get all currently active processors."""
         return [p for p, state in self._processor_states.items() if state.is_active]
 
+    def _refresh_active_processors(self) -> None:
+        """Rebuild the cached active processors of the current context.
+
+        State objects are mutated in place for as long as a processor is
+        registered, so the cached states stay valid until the next refresh.
+        """
+        context = self._current_context or []
+        states = self._processor_states
+        self._active_processors = [
+            p for p in context if p in states and states[p].is_active
+        ]
+        self._active_states = [states[p] for p in self._active_processors]
+        sync_processors = self._sync_processors
+        self._active_sync = [p in sync_processors for p in self._active_processors]
+
+    def _activate_processors(self, context: list[TickProcessor]) -> None:
+        """Mark all processors of a context active and cache them in one pass."""
+        states = [self._processor_states[p] for p in context]
+        for state in states:
+            state.is_active = True
+        sync_processors = self._sync_processors
+        self._active_processors = list(context)
+        self._active_states = states
+        self._active_sync = [p in sync_processors for p in context]
+
     def get_lagging_processors(self, threshold: float) -> list[TickProcessor]:
         """Get processors that are lagging behind the threshold."""
         lagging = []
         for processor in self._processors:
             state = self._processor_states[processor]
-            if state.execution_times:
-                avg_time = sum(state.execution_times) / len(state.execution_times)
-                if avg_time > threshold:
-                    lagging.append(processor)
+            if state.execution_times and state.avg_execution_time > threshold:
+                lagging.append(processor)
         return lagging
 
-    async def _execute_processor(
+    def _record_success(
+        self,
+        state: ProcessorState,
+        execution_time: float,
+        timestamp: float,
+        max_consecutive_retries: int,
+    ) -> None:
+        """Update a processor state in place after a successful execution."""
+        state.apply_execution_time(execution_time, self._config.stats_window_size)
+        state.retry_count = 0
+        state.last_timestamp = timestamp
+        state.max_consecutive_retries = max_consecutive_retries
+
+    def _tick_sync(
+        self, processor: TickProcessor, state: ProcessorState, timestamp: float
+    ) -> Exception | None:
+        """Run a first attempt of a sync processor without an event loop round trip.
+
+        Only valid for processors whose ``async_tick`` is the default wrapper
+        around ``tick``: such a call can never be interrupted by the processor
+        timeout, so skipping ``asyncio.wait_for`` does not change behavior.
+        Returns the raised error, if any, for ``_execute_processor`` to retry.
+        """
+        if not state.is_active:
+            return None
+        start_time = time.perf_counter()
+        try:
+            processor.tick(timestamp)
+        except TimeoutError as e:
+            return self._timeout_error(e)
+        except Exception as e:
+            return e
+        self._record_success(
+            state,
+            time.perf_counter() - start_time,
+            timestamp,
+            state.max_consecutive_retries,
+        )
+        return None
+
+    async def _attempt_processor(
         self, processor: TickProcessor, timestamp: float
+    ) -> Exception | None:
+        """Run a single attempt of a processor tick, returning its error if any."""
+        try:
+            # Always enforce the processor timeout in both modes
+            # The difference is that realtime mode can skip ticks if needed
+            await asyncio.wait_for(
+                processor.async_tick(timestamp),
+                timeout=self._config.processor_timeout,
+            )
+        except TimeoutError as e:
+            return self._timeout_error(e)
+        except Exception as e:
+            return e
+        return None
+
+    def _timeout_error(self, cause: TimeoutError) -> ProcessorTimeoutError:
+        """Wrap a processor's TimeoutError in a ProcessorTimeoutError."""
+        error = ProcessorTimeoutError(
+            f"Processor execution timed out after {self._config.processor_timeout}s"
+        )
+        error.__cause__ = cause
+        return error
+
+    async def _execute_processor(
+        self,
+        processor: TickProcessor,
+        timestamp: float,
+        state: ProcessorState | None = None,
+        failure: Exception | None = None,
     ) -> None:
-        """Execute a single processor."""
-        state = self._processor_states[processor]
+        """Execute a single processor.
+
+        ``state`` may be passed to skip the lookup of the processor's state.
+        ``failure`` is the error of a first attempt already made by the caller,
+        in which case execution resumes with the first retry.
+        """
+        if state is None:
+            state = self._processor_states[processor]
         if not state.is_active:
             return
 
+        max_retries = self._config.max_retries
         retry_count = 0
-        last_error: ProcessorTimeoutError | Exception | None = None
         max_consecutive_retries = state.max_consecutive_retries
+        error = failure
 
-        while retry_count <= self._config.max_retries:
-            try:
+        while True:
+            if error is None:
                 start_time = time.perf_counter()
-                try:
-                    # Always enforce the processor timeout in both modes
-                    # The difference is that realtime mode can skip ticks if needed
-                    await asyncio.wait_for(
-                        processor.async_tick(timestamp),
-                        timeout=self._config.processor_timeout,
-                    )
-                except TimeoutError as e:
-                    error = ProcessorTimeoutError(
-                        f"Processor execution timed out after {self._config.processor_timeout}s"
+                error = await self._attempt_processor(processor, timestamp)
+                if error is None:
+                    execution_time = time.perf_counter() - start_time
+                    self._record_success(
+                        state, execution_time, timestamp, max_consecutive_retries
                     )
-                    last_error = error
-                    retry_count += 1
-                    max_consecutive_retries = max(max_consecutive_retries, retry_count)
-                    logger.warning(
-                        "Processor %s timed out (retry %d/%d)",
-                        processor,
-                        retry_count,
-                        self._config.max_retries,
-                    )
-                    if retry_count <= self._config.max_retries:
-                        await asyncio.sleep(0.1 * (2 ** (retry_count - 1)))
-                        continue
-                    raise error from e
-
-                execution_time = time.perf_counter() - start_time
+                    return
 
-                # Update processor state after successful execution
-                new_state = state.update_execution_time(
-                    execution_time, self._config.stats_window_size
-                )
-                self._processor_states[processor] = new_state.model_copy(
-                    update={
-                        "retry_count": 0,
-                        "last_timestamp": timestamp,
-                        "max_consecutive_retries": max_consecutive_retries,
-                    }
+            retry_count += 1
+            max_consecutive_retries = max(max_consecutive_retries, retry_count)
+            if isinstance(error, ProcessorTimeoutError):
+                logger.warning(
+                    "Processor %s timed out (retry %d/%d)",
+                    processor,
+                    retry_count,
+                    max_retries,
                 )
-
-                return
-
-            except ProcessorTimeoutError:
-                # Don't retry on timeout errors after all retries are exhausted
-                break
-
-            except Exception as e:
-                last_error = e
-                retry_count += 1
-                max_consecutive_retries = max(max_consecutive_retries, retry_count)
+            else:
                 logger.warning(
                     "Processor %s error (retry %d/%d): %s",
                     processor,
                     retry_count,
-                    self._config.max_retries,
-                    e,
+                    max_retries,
+                    error,
                 )
+            if retry_count > max_retries:
+                break
+            await asyncio.sleep(0.1 * (2 ** (retry_count - 1)))
+            error = None
+
+        logger.error(
+            "Processor %s failed after %d retries: %s",
+            processor,
+            retry_count,
+            error,
+        )
+        state.apply_error(error, timestamp)
+        state.last_timestamp = timestamp
+        state.retry_count = retry_count
+        state.max_consecutive_retries = max_consecutive_retries
+        raise error
+
+    @staticmethod
+    async def _wait_fail_fast(tasks: list[asyncio.Task[None]]) -> None:
+        """Wait for all tasks, cancelling the remaining ones once any task fails."""
+        pending = {task for task in tasks if not task.done()}
+        failed = any(
+            not task.cancelled() and task.exception() is not None
+            for task in tasks
+            if task.done()
+        )
+        if pending and not failed:
+            try:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_EXCEPTION
+                )
+            except asyncio.CancelledError:
+                for task in pending:
+                    task.cancel()
+                raise
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    async def _execute_concurrently(
+        self, processors: list[TickProcessor], states: list[ProcessorState]
+    ) -> list[Exception]:
+        """Execute processors concurrently and collect their errors in order."""
+        # Eager tasks run synchronously until their first suspension, so
+        # processors that never await complete without a loop round-trip.
+        loop = asyncio.get_running_loop()
+        tasks = [
+            asyncio.eager_task_factory(
+                loop, self._execute_processor(processor, self._current_tick, state)
+            )
+            for processor, state in zip(processors, states, strict=True)
+        ]
 
-                if retry_count <= self._config.max_retries:
-                    await asyncio.sleep(0.1 * (2 ** (retry_count - 1)))
-                else:
-                    break
+        await self._wait_fail_fast(tasks)
 
-        if last_error:
-            logger.error(
-                "Processor %s failed after %d retries: %s",
-                processor,
-                retry_count,
-                last_error,
-            )
-            new_state = state.record_error(last_error, timestamp)
-            self._processor_states[processor] = new_state.model_copy(
-                update={
-                    "last_timestamp": timestamp,
-                    "retry_count": retry_count,
-                    "max_consecutive_retries": max_consecutive_retries,
-                }
-            )
-            raise last_error
+        errors: list[Exception] = []
+        for processor, task in zip(processors, tasks, strict=True):
+            if task.cancelled():
+                continue
+            # Re-raising the task's own exception is free on success and
+            # avoids an exception() lookup plus type check per processor
+            try:
+                task.result()
+            except Exception as e:
+                if self._error_callback:
+                    self._error_callback(processor, e)
+                errors.append(e)
+        return errors
 
-    async def _execute_tick(self, processors: list[TickProcessor]) -> None:
-        """Execute a tick for all processors.
+    async def _execute_tick(self) -> None:
+        """Execute a tick for all active processors.
 
         Handles both concurrent and sequential execution based on config.
         Publishes a ClockTickEvent after all processors have been executed.
         """
-        self._tick_counter += 1
-
-        if self._config.concurrent_processors:
-            tasks = [
-                asyncio.create_task(
-                    self._execute_processor(processor, self._current_tick)
-                )
-                for processor in processors
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            errors: list[Exception] = []
-
-            for processor, result in zip(processors, results, strict=True):
-                if isinstance(result, Exception):
-                    if self._error_callback:
-                        self._error_callback(processor, result)
-                    errors.append(result)
-
-            self.publish(
-                self.tick_publication,
-                ClockTickEvent(
-                    timestamp=self._current_tick,
-                    tick_counter=self._tick_counter,
-                    processors=self.get_active_processors(),
-                ),
-            )
-
-            if errors:
-                raise errors[0]
+        # The counter must be current on every tick for the ClockTickEvent and
+        # for processors reading tick_counter, so it cannot be derived after
+        # a run; read it and the timestamp once instead
+        tick_counter = self._tick_counter = self._tick_counter + 1
+        timestamp = self._current_tick
+        processors = self._active_processors
+        states = self._active_states
+
+        errors: list[Exception] = []
+        if self._config.concurrent_processors and len(processors) > 1:
+            errors = await self._execute_concurrently(processors, states)
         else:
-            errors = []
-            for processor in processors:
+            sync_flags = self._active_sync
+            for processor, state, is_sync in zip(
+                processors, states, sync_flags, strict=True
+            ):
                 try:
-                    await self._execute_processor(processor, self._current_tick)
+                    if not is_sync:
+                        await self._execute_processor(processor, timestamp, state)
+                    elif error := self._tick_sync(processor, state, timestamp):
+                        await self._execute_processor(
+                            processor, timestamp, state, failure=error
+                        )
                 except Exception as e:
                     if self._error_callback:
                         self._error_callback(processor, e)
                     errors.append(e)
                     break
 
-            self.publish(
-                self.tick_publication,
-                ClockTickEvent(
-                    timestamp=self._current_tick,
-                    tick_counter=self._tick_counter,
-                    processors=self.get_active_processors(),
-                ),
-            )
+        self.publish(
+            self.tick_publication,
+            ClockTickEvent(
+                timestamp=timestamp,
+                tick_counter=tick_counter,
+                processors=list(self._active_processors),
+            ),
+        )
 
-            if errors:
-                raise errors[0]
+        if errors:
+            raise errors[0]
 
     def _cleanup(self, error_occurred: bool = False) -> None:
         """Clean up the clock state.
@@ -539,18 +669,15 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
         for processor in self._processors:
             state = self._processor_states.get(processor)
             if state is not None:
-                self._processor_states[processor] = state.model_copy(
-                    update={
-                        "is_active": False,
-                        "retry_count": 0,
-                        "consecutive_errors": 0,
-                    }
-                )
+                state.is_active = False
+                state.retry_count = 0
+                state.consecutive_errors = 0
 
         # Always fully reset clock state so it can be reused
         self._running = False
         self._started = False
         self._current_context = None
+        self._refresh_active_processors()
         self._task = None
         self._shutdown_event.clear()
 
@@ -590,15 +717,13 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
                 try:
                     self._current_context.append(processor)
                     processor.start(self._current_tick)
-                    state = self._processor_states.get(processor, ProcessorState())
-                    self._processor_states[processor] = state.model_copy(
-                        update={
-                            "is_active": True,
-                            "last_timestamp": self._current_tick,
-                            "retry_count": 0,
-                            "consecutive_errors": 0,
-                        }
+                    state = self._processor_states.setdefault(
+                        processor, ProcessorState()
                     )
+                    state.is_active = True
+                    state.last_timestamp = self._current_tick
+                    state.retry_count = 0
+                    state.consecutive_errors = 0
                 except Exception as e:
                     # Clean up any processors that were started
                     for p in self._current_context:
@@ -609,6 +734,7 @@ class BaseClock(AsyncContextManager, MultiPublisher, ABC):
                     self._cleanup(error_occurred=True)
                     raise ClockError(f"Failed to start processor: {e}") from e
 
+            self._refresh_active_processors()
             return self
         except:
             self._cleanup(error_occurred=True)
@@ -40,6 +40,11 @@ class ClockConfig(BaseModel):
         le=10000,
         description="Number of executions to keep for statistics",
     )
+    tick_batch_size: int = Field(
+        default=64,
+        gt=0,
+        description="Number of backtest ticks to execute between event loop yields",
+    )
 
     @field_validator("end_time")
     @classmethod
@@ -61,6 +61,8 @@ class RealtimeClock(BaseClock):
             except Exception as e:
                 self._processors.remove(processor)
                 self._processor_states.pop(processor, None)
+                self._sync_processors.discard(processor)
+                self._refresh_active_processors()
                 raise ClockError(f"Failed to start processor: {str(e)}") from e
 
         # Calculate the actual target time based on current time
@@ -68,40 +70,29 @@ class RealtimeClock(BaseClock):
         duration = target_time - self._current_tick
         actual_target = current_time + duration
 
-        self._task = asyncio.create_task(
-            self._run_til_impl(actual_target, self._current_context)
-        )
+        self._task = asyncio.create_task(self._run_til_impl(actual_target))
 
-        # Activate all processors
-        for processor in self._current_context:
-            state = self._processor_states[processor]
-            self._processor_states[processor] = state.model_copy(
-                update={"is_active": True}
-            )
+        self._activate_processors(self._current_context)
 
         try:
             await self._task
         finally:
             self._task = None
 
-    async def _run_til_impl(
-        self, target_time: float, processors: list[TickProcessor]
-    ) -> None:
+    async def _run_til_impl(self, target_time: float) -> None:
         """Run the clock until a specific timestamp."""
         if not self._running:
             raise ClockError("Clock must be started.")
 
         while time.time() < target_time:
-            processors = [p for p in processors if self._processor_states[p].is_active]
-            await self._execute_tick(processors)
+            await self._execute_tick()
             await self._wait_next_tick()
 
     async def _wait_next_tick(self) -> None:
         """Wait until the next tick."""
+        tick_size = self._tick_size
         current_time = time.time()
-        next_tick = (
-            current_time // self._config.tick_size + 1
-        ) * self._config.tick_size
+        next_tick = (current_time // tick_size + 1) * tick_size
         wait_time = next_tick - current_time
 
         if wait_time > 0:
@@ -113,7 +104,7 @@ class RealtimeClock(BaseClock):
         # Account for any drift that occurred during sleep
         actual_time = time.time()
         if actual_time > next_tick:
-            ticks_passed = int((actual_time - next_tick) / self._config.tick_size)
+            ticks_passed = int((actual_time - next_tick) / tick_size)
             if ticks_passed > 0:
                 logger.debug(
                     "Clock drift detected: caught up %d tick boundaries (drift=%.3fs)",
@@ -122,6 +113,4 @@ class RealtimeClock(BaseClock):
                 )
 
         # Set current tick to aligned boundary (consistent with initialization)
-        self._current_tick = (
-            actual_time // self._config.tick_size
-        ) * self._config.tick_size
+        self._current_tick = (actual_time // tick_size) * tick_size
@@ -1,15 +1,35 @@
-import statistics
+import math
+from collections.abc import Sequence
 from datetime import datetime
 from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+def _interpolate_percentile(sorted_times: Sequence[float], percentile: float) -> float:
+    """Linearly interpolate a percentile (0-100) of sorted values."""
+    # Convert percentile to quantile (e.g., 95 -> 0.95)
+    quantile = percentile / 100
+    idx = quantile * (len(sorted_times) - 1)
+    if idx.is_integer():
+        return sorted_times[int(idx)]
+    # Interpolate between two values
+    lower_idx = int(idx)
+    fraction = idx - lower_idx
+    return (1 - fraction) * sorted_times[lower_idx] + fraction * sorted_times[
+        lower_idx + 1
+    ]
+
+
 class ProcessorState(BaseModel):
-    """State and statistics of a tick processor within the clock."""
+    """State and statistics of a tick processor within the clock.
+
+    The model is mutable: the clock updates the state it owns in place on
+    every tick instead of copying it.
+    """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(
-        frozen=True, arbitrary_types_allowed=True
+        frozen=False, validate_assignment=False, arbitrary_types_allowed=True
     )
 
     # State fields
@@ -74,12 +94,20 @@ class ProcessorState(BaseModel):
 
     @property
     def std_dev_execution_time(self) -> float:
-        """Standard deviation of execution times."""
-        return (
-            statistics.stdev(self.execution_times)
-            if len(self.execution_times) > 1
-            else 0.0
-        )
+        """Sample standard deviation of execution times.
+
+        Computed in a single pass with Welford's online algorithm, which is
+        numerically stable without the exact arithmetic of statistics.stdev.
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for value in self.execution_times:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        return math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
 
     @property
     def error_rate(self) -> float:
@@ -96,54 +124,56 @@ class ProcessorState(BaseModel):
         Returns:
             The execution time at the specified percentile
         """
+        return self.get_execution_percentiles([percentile])[0]
+
+    def get_execution_percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        """Get several percentiles of execution times, sorting them only once.
+
+        Args:
+            percentiles: The percentiles to calculate (0-100)
+
+        Returns:
+            The execution times at the specified percentiles, in the same order
+        """
         if not self.execution_times:
-            return 0.0
+            return [0.0] * len(percentiles)
         if len(self.execution_times) == 1:
-            return self.execution_times[0]
+            return [self.execution_times[0]] * len(percentiles)
 
-        # Convert percentile to quantile (e.g., 95 -> 0.95)
-        quantile = percentile / 100
         sorted_times = sorted(self.execution_times)
-        idx = quantile * (len(sorted_times) - 1)
-        if idx.is_integer():
-            return sorted_times[int(idx)]
-        # Interpolate between two values
-        lower_idx = int(idx)
-        fraction = idx - lower_idx
-        return (1 - fraction) * sorted_times[lower_idx] + fraction * sorted_times[
-            lower_idx + 1
-        ]
+        return [_interpolate_percentile(sorted_times, p) for p in percentiles]
+
+    def apply_execution_time(self, execution_time: float, window_size: int) -> None:
+        """Record a successful execution in place, keeping the window size."""
+        execution_times = self.execution_times
+        execution_times.append(execution_time)
+        overflow = len(execution_times) - window_size
+        if overflow > 0:
+            del execution_times[:overflow]
+        self.execution_times = execution_times
+        self.consecutive_errors = 0
+        self.last_success_time = datetime.now()
+
+    def apply_error(self, error: Exception, timestamp: float) -> None:
+        """Record an error occurrence in place."""
+        self.error_count += 1
+        self.consecutive_errors += 1
+        self.last_error = str(error)
+        self.last_error_time = datetime.fromtimestamp(timestamp)
 
     def update_execution_time(
         self, execution_time: float, window_size: int
     ) -> "ProcessorState":
         """Update execution times list while maintaining window size."""
-        # Efficient: only keep the tail we need, then append
-        if len(self.execution_times) >= window_size:
-            execution_times = list(self.execution_times[-(window_size - 1) :])
-        else:
-            execution_times = list(self.execution_times)
-        execution_times.append(execution_time)
-
-        return self.model_copy(
-            update={
-                "execution_times": execution_times,
-                "consecutive_errors": 0,
-                "last_success_time": datetime.now(),
-            }
-        )
+        state = self.model_copy(deep=True)
+        state.apply_execution_time(execution_time, window_size)
+        return state
 
     def record_error(self, error: Exception, timestamp: float) -> "ProcessorState":
         """Record an error occurrence."""
-        now = datetime.fromtimestamp(timestamp)
-        return self.model_copy(
-            update={
-                "error_count": self.error_count + 1,
-                "consecutive_errors": self.consecutive_errors + 1,
-                "last_error": str(error),
-                "last_error_time": now,
-            }
-        )
+        state = self.model_copy(deep=True)
+        state.apply_error(error, timestamp)
+        return state
 
     def update_retry_count(self, retry_count: int) -> "ProcessorState":
         """Update retry count and track maximum consecutive retries."""
@@ -153,9 +183,10 @@ class ProcessorState(BaseModel):
                 "max_consecutive_retries": max(
                     self.max_consecutive_retries, retry_count
                 ),
-            }
+            },
+            deep=True,
         )
 
     def reset_retries(self) -> "ProcessorState":
         """Reset retry count after successful execution."""
-        return self.model_copy(update={"retry_count": 0})
+        return self.model_copy(update={"retry_count": 0}, deep=True)
@@ -1,8 +1,13 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from chronopype.clocks.backtest import BacktestClock
 from chronopype.clocks.config import ClockConfig
-from chronopype.exceptions import ClockError
+from chronopype.clocks.modes import ClockMode
+from chronopype.exceptions import ClockError, ProcessorTimeoutError
+from chronopype.processors.base import TickProcessor
 from tests.conftest import MockProcessor
 
 
@@ -70,6 +75,54 @@ async def test_step_single(clock: BacktestClock, mock_processor: MockProcessor)
         assert clock.current_timestamp == clock.start_time + 1.0
 
 
+async def test_processor_states_are_detached_copies(
+    clock: BacktestClock, mock_processor: MockProcessor
+) -> None:
+    """Test that processor_states is not updated by later ticks."""
+    clock.add_processor(mock_processor)
+
+    async with clock:
+        await clock.step()
+        states = clock.processor_states
+        await clock.step()
+
+    assert len(states[mock_processor].execution_times) == 1
+    assert states[mock_processor].last_timestamp == clock.start_time + 1.0
+
+
+async def test_state_helper_copies_are_detached(
+    clock: BacktestClock, mock_processor: MockProcessor
+) -> None:
+    """Test that helper copies of a live state are not updated by later ticks."""
+    clock.add_processor(mock_processor)
+
+    async with clock:
+        await clock.step(2)
+        state = clock.get_processor_state(mock_processor)
+        assert state is not None
+        snapshot = state.reset_retries()
+        await clock.step(2)
+
+    assert len(snapshot.execution_times) == 2
+    assert len(state.execution_times) == 4
+
+
+async def test_tick_updates_mark_state_fields_set(
+    clock: BacktestClock, mock_processor: MockProcessor
+) -> None:
+    """Test that in-place state updates are kept by exclude_unset dumps."""
+    clock.add_processor(mock_processor)
+
+    async with clock:
+        await clock.step()
+        dumped = mock_processor.state.model_dump(exclude_unset=True)
+
+    assert dumped["is_active"] is True
+    assert dumped["last_timestamp"] == clock.start_time + 1.0
+    assert len(dumped["execution_times"]) == 1
+    assert "last_success_time" in dumped
+
+
 async def test_step_multiple(
     clock: BacktestClock, mock_processor: MockProcessor
 ) -> None:
@@ -103,6 +156,30 @@ async def test_step_sequential_calls(
         assert mock_processor.last_timestamp == clock.start_time + 4.0
 
 
+async def test_step_calls_do_not_accumulate_drift(
+    mock_processor: MockProcessor,
+) -> None:
+    """Test that many single steps at epoch scale land exactly on the grid."""
+    start = 1_700_000_000.0
+    clock = BacktestClock(
+        ClockConfig(
+            clock_mode=ClockMode.BACKTEST,
+            tick_size=0.1,
+            start_time=start,
+            end_time=start + 2000.0,
+        )
+    )
+    clock.add_processor(mock_processor)
+
+    async with clock:
+        for _ in range(10_000):
+            await clock.step()
+        assert clock.current_timestamp == start + 1000.0
+
+        await clock.run_til(start + 1000.5)
+        assert mock_processor.last_timestamp == start + 1000.5
+
+
 async def test_step_past_end_time(
     clock: BacktestClock, mock_processor: MockProcessor
 ) -> None:
@@ -247,3 +324,151 @@ async def test_backtest_deterministic(clock: BacktestClock) -> None:
     for p in processors:
         assert p.tick_count == 1
         assert p.last_timestamp == clock.start_time + 1
+
+
+async def test_run_til_executes_ticks_in_batches(
+    clock_config: ClockConfig, mock_processor: MockProcessor
+) -> None:
+    """Test that run_til groups ticks into batches of tick_batch_size."""
+    clock = BacktestClock(clock_config.model_copy(update={"tick_batch_size": 4}))
+    clock.add_processor(mock_processor)
+
+    batch_sizes: list[int] = []
+    execute_tick_batch = clock._execute_tick_batch
+
+    async def spy(timestamps):  # type: ignore[no-untyped-def]
+        batch_sizes.append(len(timestamps))
+        await execute_tick_batch(timestamps)
+
+    clock._execute_tick_batch = spy  # type: ignore[method-assign]
+
+    async with clock:
+        await clock.run_til(clock.end_time)
+
+    assert batch_sizes == [4, 4, 2]
+    assert mock_processor.tick_count == 10
+    assert mock_processor.last_timestamp == clock.end_time
+
+
+async def test_shutdown_from_another_task_keeps_caller_running(
+    clock: BacktestClock, mock_processor: MockProcessor
+) -> None:
+    """Test that shutdown() only cancels the clock's own run task."""
+    mock_processor.sleep_time = 0.05
+    clock.add_processor(mock_processor)
+
+    async def stopper() -> str:
+        await asyncio.sleep(0.01)
+        await clock.shutdown()
+        return "stopped"
+
+    async with clock:
+        stop_task = asyncio.create_task(stopper())
+        try:
+            await clock.run_til(clock.start_time + 5)
+        except asyncio.CancelledError:
+            # The internal run task was cancelled, not the calling task
+            pass
+        assert await asyncio.wait_for(stop_task, timeout=1.0) == "stopped"
+
+        current = asyncio.current_task()
+        assert current is not None
+        assert current.cancelling() == 0
+        assert clock._task is None
+
+
+class SyncProcessor(TickProcessor):
+    """A processor implementing only the synchronous tick."""
+
+    def __init__(self, failures: int = 0) -> None:
+        super().__init__()
+        self.failures = failures
+        self.timestamps: list[float] = []
+
+    def tick(self, timestamp: float) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ValueError("Sync error")
+        self.timestamps.append(timestamp)
+
+
+async def test_sync_processors_ticked_directly(clock: BacktestClock) -> None:
+    """Test that sync-only processors are ticked without asyncio.wait_for."""
+    processors = [SyncProcessor(), SyncProcessor()]
+    for processor in processors:
+        clock.add_processor(processor)
+
+    async with clock:
+        assert clock._active_sync == [True, True]
+        with patch("asyncio.wait_for") as wait_for:
+            await clock.run_til(clock.start_time + 3)
+        wait_for.assert_not_called()
+
+        for processor in processors:
+            assert processor.timestamps == [1001.0, 1002.0, 1003.0]
+            state = clock.get_processor_state(processor)
+            assert state is not None
+            assert len(state.execution_times) == 3
+            assert state.last_timestamp == 1003.0
+
+
+async def test_sync_processor_retries(clock: BacktestClock) -> None:
+    """Test that a failing sync processor keeps the retry semantics."""
+    processor = SyncProcessor(failures=2)
+    clock.add_processor(processor)
+
+    async with clock:
+        await clock.step()
+        state = clock.get_processor_state(processor)
+        assert state is not None
+        assert processor.timestamps == [1001.0]
+        assert state.max_consecutive_retries == 2
+        assert state.error_count == 0
+
+        processor.failures = clock.config.max_retries + 1
+        with pytest.raises(ValueError, match="Sync error"):
+            await clock.step()
+        assert state.error_count == 1
+        assert state.retry_count == clock.config.max_retries + 1
+
+
+async def test_sync_processor_timeout_error_is_wrapped(
+    clock: BacktestClock,
+) -> None:
+    """Test that a sync processor raising TimeoutError reports a processor timeout."""
+
+    class TimingOutProcessor(TickProcessor):
+        def tick(self, timestamp: float) -> None:
+            raise TimeoutError("upstream timed out")
+
+    clock._config = clock.config.model_copy(update={"max_retries": 0})
+    processor = TimingOutProcessor()
+    clock.add_processor(processor)
+
+    async with clock:
+        with pytest.raises(ProcessorTimeoutError) as exc_info:
+            await clock.step()
+
+    assert isinstance(exc_info.value.__cause__, TimeoutError)
+
+
+async def test_mixed_processors_tick_sync_directly(
+    clock: BacktestClock, mock_processor: MockProcessor
+) -> None:
+    """Test that only async processors go through asyncio.wait_for."""
+    sync_processor = SyncProcessor()
+    clock.add_processor(sync_processor)
+    clock.add_processor(mock_processor)
+    assert clock._sync_processors == {sync_processor}
+
+    async with clock:
+        assert clock._active_sync == [True, False]
+        with patch("asyncio.wait_for", wraps=asyncio.wait_for) as wait_for:
+            await clock.run_til(clock.start_time + 2)
+        assert wait_for.call_count == 2
+
+    assert sync_processor.timestamps == [1001.0, 1002.0]
+    assert mock_processor.tick_count == 2
+
+    clock.remove_processor(sync_processor)
+    assert not clock._sync_processors
@@ -5,7 +5,15 @@ import asyncio
 import pytest
 from pydantic import ValidationError
 
-from chronopype.clocks.backtest import BacktestClock
+from chronopype.clocks.backtest import (
+    _TICK_SCALE,
+    BacktestClock,
+    _tick_count,
+    _tick_grid,
+    _tick_timestamps,
+    _to_ns,
+)
+from chronopype.clocks.base import ClockTickEvent
 from chronopype.clocks.config import ClockConfig
 from chronopype.clocks.modes import ClockMode
 from chronopype.exceptions import ClockError
@@ -97,7 +105,7 @@ async def test_run_til_impl_not_running(clock_config: ClockConfig):
         # Directly call _run_til_impl with _running=False
         clock._running = False
         with pytest.raises(ClockError, match="Clock must be started in a context."):
-            await clock._run_til_impl(1005.0, [])
+            await clock._run_til_impl(1005.0)
 
 
 # --- Line 76: num_ticks <= 0 in _run_til_impl ---
@@ -109,7 +117,7 @@ async def test_run_til_impl_zero_ticks(clock_config: ClockConfig):
     async with clock:
         clock._running = True
         # Target time == current tick => num_ticks=0 => early return
-        await clock._run_til_impl(clock._current_tick, [])
+        await clock._run_til_impl(clock._current_tick)
         # Should return without error
 
 
@@ -130,8 +138,8 @@ async def test_run_til_impl_float_remainder():
     async with clock:
         await clock.run_til(1.0)
 
-    # tick_size=0.3 into 1.0: int(1.0/0.3)=3 ticks => 0.9
-    # remainder 0.1 > FLOAT_EPSILON => extra tick at 1.0
+    # tick_size=0.3 into 1.0: 1.0 // 0.3 = 3 ticks => 0.9
+    # non-zero remainder 0.1 => extra tick at 1.0
     # So 3 + 1 = 4 ticks total
     assert processor.tick_count == 4
     assert clock._current_tick == 1.0
@@ -159,6 +167,101 @@ async def test_step_to_float_remainder():
     assert result == 1.0
 
 
+# --- _tick_timestamps helper ---
+
+
+def _timestamps(current: float, target: float, tick_size: float) -> list[float]:
+    ticks = _tick_timestamps(_to_ns(current), _to_ns(target), _to_ns(tick_size))
+    return [tick / _TICK_SCALE for tick in ticks]
+
+
+def _grid(current: float, tick_size: float, num_ticks: int) -> list[float]:
+    ticks = _tick_grid(_to_ns(current), _to_ns(tick_size), num_ticks)
+    return [tick / _TICK_SCALE for tick in ticks]
+
+
+def test_tick_timestamps_whole_ticks():
+    assert _timestamps(1000.0, 1003.0, 1.0) == [1001.0, 1002.0, 1003.0]
+
+
+def test_tick_timestamps_remainder_aligned_to_target():
+    assert _timestamps(0.0, 1.0, 0.3) == [0.3, 0.6, 0.9, 1.0]
+
+
+def test_tick_timestamps_do_not_accumulate_drift():
+    timestamps = _timestamps(0.0, 1.0, 0.1)
+    assert len(timestamps) == 10
+    assert timestamps[2] == 0.3
+    assert timestamps[-1] == 1.0
+
+
+def test_tick_timestamps_are_lazy():
+    timestamps = _tick_timestamps(0, 10_000_000 * _TICK_SCALE, _TICK_SCALE)
+    assert not isinstance(timestamps, list)
+    assert next(timestamps) == _TICK_SCALE
+    assert _tick_count(0, 10_000_000 * _TICK_SCALE, _TICK_SCALE) == 10_000_000
+
+
+def test_tick_grid_uses_tick_index():
+    assert _grid(1000.0, 0.1, 3) == [1000.1, 1000.2, 1000.3]
+    assert _grid(0.0, 0.1, 30)[-1] == 3.0
+    assert _grid(0.0, 1.0, 0) == []
+
+
+def test_tick_timestamps_no_ticks():
+    assert _timestamps(1000.0, 1000.0, 1.0) == []
+    assert _timestamps(1000.0, 1000.5, 1.0) == []
+    assert _timestamps(1000.0, 999.0, 1.0) == []
+    assert _tick_count(_to_ns(1000.0), _to_ns(1000.5), _to_ns(1.0)) == 0
+
+
+def test_tick_timestamps_epoch_scale():
+    start = 1_700_000_000.0
+    assert _timestamps(start, start + 0.75, 0.25) == [
+        1_700_000_000.25,
+        1_700_000_000.5,
+        1_700_000_000.75,
+    ]
+    assert _timestamps(start + 0.75, start + 1.75, 0.25) == [
+        1_700_000_001.0,
+        1_700_000_001.25,
+        1_700_000_001.5,
+        1_700_000_001.75,
+    ]
+    assert _grid(start, 0.25, 4000)[-1] == 1_700_001_000.0
+
+
+def test_to_ns_is_exact_at_epoch_scale():
+    assert _to_ns(1_700_000_000.75) == 1_700_000_000_750_000_000
+    assert _to_ns(0.1) == 100_000_000
+
+
+async def test_run_til_epoch_scale_stays_on_grid():
+    start = 1_700_000_000.0
+    config = ClockConfig(
+        clock_mode=ClockMode.BACKTEST,
+        tick_size=0.25,
+        start_time=start,
+        end_time=start + 10.0,
+    )
+    clock = BacktestClock(config)
+    timestamps: list[float] = []
+
+    def on_tick(event: ClockTickEvent) -> None:
+        timestamps.append(event.timestamp)
+
+    clock.add_subscriber_with_callback(
+        clock.tick_publication, on_tick, with_event_info=False
+    )
+    clock.add_processor(MockProcessor("epoch"))
+
+    async with clock:
+        await clock.run_til(start + 0.75)
+        await clock.run_til(start + 1.75)
+
+    assert timestamps == [start + 0.25 * i for i in range(1, 8)]
+
+
 # --- Line 182: fast_forward outside context ---
 
 
@@ -197,6 +300,53 @@ async def test_fast_forward_past_end_time(clock_config: ClockConfig):
             await clock.fast_forward(999.0)
 
 
+async def test_fast_forward_already_running(clock_config: ClockConfig):
+    clock = BacktestClock(clock_config)
+    processor = MockProcessor("ff_running")
+    processor.sleep_time = 0.5
+    clock.add_processor(processor)
+
+    async with clock:
+        task = asyncio.create_task(clock.run_til(clock_config.end_time))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ClockError, match="Clock is already running"):
+            await clock.fast_forward(1.0)
+
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+async def test_fast_forward_repeatedly_to_end_time(clock_config: ClockConfig):
+    clock = BacktestClock(clock_config)
+    processor = MockProcessor("ff_loop")
+    clock.add_processor(processor)
+
+    async with clock:
+        for _ in range(10):
+            await clock.fast_forward(1.0)
+        assert clock.current_timestamp == clock_config.end_time
+
+        with pytest.raises(
+            ClockError, match="Cannot fast forward past end_time in backtest mode"
+        ):
+            await clock.fast_forward(1.0)
+
+    assert processor.tick_count == 10
+    assert processor.last_timestamp == clock_config.end_time
+
+
+async def test_fast_forward_zero_seconds_outside_context(clock_config: ClockConfig):
+    clock = BacktestClock(clock_config)
+    with pytest.raises(
+        ClockError, match="Fast forward can only be used within a context"
+    ):
+        await clock.fast_forward(0)
+
+
 # --- Config validation ---
 
 
@@ -235,6 +385,14 @@ class TestConfigValidation:
         config = ClockConfig(clock_mode=ClockMode.BACKTEST, max_retries=0)
         assert config.max_retries == 0
 
+    def test_tick_batch_size_must_be_positive(self):
+        with pytest.raises(ValidationError, match="tick_batch_size"):
+            ClockConfig(clock_mode=ClockMode.BACKTEST, tick_batch_size=0)
+
+    def test_tick_batch_size_default(self):
+        config = ClockConfig(clock_mode=ClockMode.BACKTEST)
+        assert config.tick_batch_size == 64
+
 
 # --- Stats window sync from clock to processor ---
 
@@ -1,5 +1,4 @@
 import asyncio
-from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -11,55 +10,51 @@ from tests.conftest import MockProcessor
 
 
 @pytest.mark.parametrize(
-    "clock_fixture,expected_mode",
+    "any_clock,expected_mode",
     [
         ("clock", ClockMode.BACKTEST),
         ("realtime_clock", ClockMode.REALTIME),
     ],
+    indirect=["any_clock"],
 )
-def test_clock_initialization(
-    clock_fixture: str, expected_mode: ClockMode, request: Any
-) -> None:
+def test_clock_initialization(any_clock: BaseClock, expected_mode: ClockMode) -> None:
     """Test basic clock initialization for both clock types."""
-    clock = request.getfixturevalue(clock_fixture)
-    assert isinstance(clock, BaseClock)
-    assert clock.clock_mode == expected_mode
-    assert clock.tick_size > 0
-    assert len(clock.processors) == 0
+    assert isinstance(any_clock, BaseClock)
+    assert any_clock.clock_mode == expected_mode
+    assert any_clock.tick_size > 0
+    assert len(any_clock.processors) == 0
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 def test_processor_management(
-    clock_fixture: str, request: Any, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test processor management for both clock types."""
-    clock = request.getfixturevalue(clock_fixture)
 
     # Add processor
-    clock.add_processor(mock_processor)
-    assert mock_processor in clock.processors
-    assert len(clock.processors) == 1
+    any_clock.add_processor(mock_processor)
+    assert mock_processor in any_clock.processors
+    assert len(any_clock.processors) == 1
 
-    state = clock.get_processor_state(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert not state.is_active
 
     # Remove processor
-    clock.remove_processor(mock_processor)
-    assert mock_processor not in clock.processors
-    assert len(clock.processors) == 0
+    any_clock.remove_processor(mock_processor)
+    assert mock_processor not in any_clock.processors
+    assert len(any_clock.processors) == 0
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
-def test_context_manager_errors(clock_fixture: str, request: Any) -> None:
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
+def test_context_manager_errors(any_clock: BaseClock) -> None:
     """Test context manager error cases for both clock types."""
-    clock = request.getfixturevalue(clock_fixture)
 
     # Test nested context
     async def test_nested() -> None:
-        async with clock:
+        async with any_clock:
             with pytest.raises(ClockContextError):
-                async with clock:
+                async with any_clock:
                     pass
 
     asyncio.run(test_nested())
@@ -67,48 +62,47 @@ def test_context_manager_errors(clock_fixture: str, request: Any) -> None:
     # Test re-entry after error - clock should be reusable
     async def test_reentry() -> None:
         try:
-            async with clock:
+            async with any_clock:
                 raise ValueError("Test error")
         except ValueError:
             pass  # Expected error
 
         # Clock should be reusable after error cleanup
-        async with clock:
+        async with any_clock:
             pass  # Should succeed - context was properly cleaned up
 
     asyncio.run(test_reentry())
 
     # Test running flag prevents re-entry
-    clock._running = True
+    any_clock._running = True
 
     async def test_running() -> None:
         with pytest.raises(ClockContextError):
-            async with clock:
+            async with any_clock:
                 pass
 
     asyncio.run(test_running())
 
     # Reset for subsequent tests
-    clock._running = False
+    any_clock._running = False
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 def test_add_processor_when_started(
-    clock_fixture: str, request: Any, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test adding a processor when the clock is already started."""
-    clock = request.getfixturevalue(clock_fixture)
-    clock._started = True  # Simulate clock started state
+    any_clock._started = True  # Simulate clock started state
 
     # Setup mock start method
     mock_processor.start = Mock()  # type: ignore
 
     # Add processor
-    clock.add_processor(mock_processor)
-    assert mock_processor in clock.processors
+    any_clock.add_processor(mock_processor)
+    assert mock_processor in any_clock.processors
 
     # Verify processor was started
-    state = clock.get_processor_state(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert state.is_active
     mock_processor.start.assert_called_once()
@@ -118,46 +112,79 @@ def test_add_processor_when_started(
     error_processor.start = Mock(side_effect=ValueError("Start error"))  # type: ignore
 
     with pytest.raises(ClockError) as exc_info:
-        clock.add_processor(error_processor)
+        any_clock.add_processor(error_processor)
     assert "Failed to start processor" in str(exc_info.value)
-    assert error_processor not in clock.processors
-    assert clock.get_processor_state(error_processor) is None
+    assert error_processor not in any_clock.processors
+    assert any_clock.get_processor_state(error_processor) is None
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 def test_remove_processor_when_active(
-    clock_fixture: str, request: Any, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test removing an active processor."""
-    clock = request.getfixturevalue(clock_fixture)
 
     # Setup mock stop method
     mock_processor.stop = Mock()  # type: ignore
 
-    clock.add_processor(mock_processor)
+    any_clock.add_processor(mock_processor)
 
     # Simulate active processor
-    state = clock.get_processor_state(mock_processor)
-    clock._processor_states[mock_processor] = state.model_copy(
-        update={"is_active": True}
-    )
+    any_clock._processor_states[mock_processor].is_active = True
 
     # Remove processor
-    clock.remove_processor(mock_processor)
-    assert mock_processor not in clock.processors
-    assert clock.get_processor_state(mock_processor) is None
+    any_clock.remove_processor(mock_processor)
+    assert mock_processor not in any_clock.processors
+    assert any_clock.get_processor_state(mock_processor) is None
     mock_processor.stop.assert_called_once()
 
     # Test error handling during stop
     error_processor = MockProcessor()
     error_processor.stop = Mock(side_effect=ValueError("Stop error"))  # type: ignore
-    clock.add_processor(error_processor)
-    clock._processor_states[error_processor] = state.model_copy(
-        update={"is_active": True}
-    )
+    any_clock.add_processor(error_processor)
+    any_clock._processor_states[error_processor].is_active = True
 
     with pytest.raises(ClockError) as exc_info:
-        clock.remove_processor(error_processor)
+        any_clock.remove_processor(error_processor)
     assert "Failed to stop processor" in str(exc_info.value)
-    assert error_processor not in clock.processors
-    assert clock.get_processor_state(error_processor) is None
+    assert error_processor not in any_clock.processors
+    assert any_clock.get_processor_state(error_processor) is None
+
+
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
+async def test_activate_processors_matches_refresh(any_clock: BaseClock) -> None:
+    """Test that bulk activation builds the same cache as a refresh."""
+    processors = [MockProcessor(f"p{i}") for i in range(3)]
+    for processor in processors:
+        any_clock.add_processor(processor)
+
+    async with any_clock:
+        any_clock.pause_processor(processors[1])
+        any_clock._activate_processors(any_clock._current_context)
+        active = (
+            any_clock._active_processors,
+            any_clock._active_states,
+            any_clock._active_sync,
+        )
+
+        assert all(any_clock._processor_states[p].is_active for p in processors)
+        any_clock._refresh_active_processors()
+        assert active == (
+            any_clock._active_processors,
+            any_clock._active_states,
+            any_clock._active_sync,
+        )
+        assert any_clock._active_processors == processors
+
+
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
+async def test_cleanup_clears_active_cache(any_clock: BaseClock) -> None:
+    """Test that leaving the context clears every active processor list."""
+    any_clock.add_processor(MockProcessor())
+
+    async with any_clock:
+        assert any_clock._active_states
+
+    assert any_clock._active_processors == []
+    assert any_clock._active_states == []
+    assert any_clock._active_sync == []
@@ -109,8 +109,7 @@ async def test_shutdown_processor_stop_raises(clock: BacktestClock):
     clock._running = True
     clock._current_context = [proc]
     # Make the processor state active so the shutdown path processes it
-    state = clock._processor_states[proc]
-    clock._processor_states[proc] = state.model_copy(update={"is_active": True})
+    clock._processor_states[proc].is_active = True
 
     # Override stop to raise
     def bad_stop():
@@ -227,8 +226,7 @@ async def test_aexit_shutdown_raises(clock_config: ClockConfig):
 
     # Start the processor so stop() works
     proc.start(1000.0)
-    state = clock._processor_states[proc]
-    clock._processor_states[proc] = state.model_copy(update={"is_active": True})
+    clock._processor_states[proc].is_active = True
 
     # Patch shutdown to raise
     async def bad_shutdown(timeout=None):
@@ -1,5 +1,7 @@
 """Tests for concurrent processor execution and pause/resume during execution."""
 
+import asyncio
+
 import pytest
 
 from chronopype.clocks.backtest import BacktestClock
@@ -66,6 +68,24 @@ class TestConcurrentExecution:
         for p in processors:
             assert p.tick_count == 3
 
+    async def test_concurrent_overlapping_steps(
+        self, concurrent_clock: BacktestClock
+    ) -> None:
+        """Overlapping steps must not share the tasks of each other's ticks."""
+        processors = [MockProcessor(f"p{i}") for i in range(3)]
+        for p in processors:
+            p.sleep_time = 0.001
+            concurrent_clock.add_processor(p)
+
+        async with concurrent_clock:
+            results = await asyncio.gather(
+                concurrent_clock.step(2), concurrent_clock.step(2)
+            )
+
+        assert results[0] == results[1] == concurrent_clock.current_timestamp
+        for p in processors:
+            assert p.tick_count == 4
+
     async def test_concurrent_faster_than_sequential(
         self, concurrent_backtest_config: ClockConfig
     ) -> None:
@@ -126,7 +146,7 @@ class TestConcurrentExecution:
             with pytest.raises(ValueError):
                 await concurrent_clock.run_til(concurrent_clock.start_time + 1)
 
-        # The good processors should have executed (gather runs all)
+        # The good processors completed before the failure was raised
         assert good1.tick_count == 1
         assert good2.tick_count == 1
         assert bad.tick_count == 0
@@ -138,6 +158,11 @@ class TestConcurrentExecution:
         self, concurrent_clock: BacktestClock
     ) -> None:
         """Multiple processor failures - first error is raised."""
+        # Without retries both processors fail on their first attempt, before
+        # the tick waits on any task, so neither is cancelled
+        concurrent_clock._config = concurrent_clock.config.model_copy(
+            update={"max_retries": 0}
+        )
         p1 = MockProcessor("fail1")
         p2 = MockProcessor("fail2")
         p1.should_raise = True
@@ -153,8 +178,29 @@ class TestConcurrentExecution:
             with pytest.raises(ValueError):
                 await concurrent_clock.run_til(concurrent_clock.start_time + 1)
 
-        # Both errors were reported via callback
-        assert len(errors) == 2
+        assert [p for p, _ in errors] == [p1, p2]
+
+    async def test_concurrent_failure_cancels_pending(
+        self, concurrent_clock: BacktestClock
+    ) -> None:
+        """Processors still running when another one fails are cancelled."""
+        bad = MockProcessor("bad")
+        slow = MockProcessor("slow")
+        bad.should_raise = True
+        slow.sleep_time = 0.9
+
+        concurrent_clock.add_processor(bad)
+        concurrent_clock.add_processor(slow)
+
+        errors: list[tuple[TickProcessor, Exception]] = []
+        concurrent_clock._error_callback = lambda p, e: errors.append((p, e))
+
+        async with concurrent_clock:
+            with pytest.raises(ValueError):
+                await concurrent_clock.run_til(concurrent_clock.start_time + 1)
+
+        assert slow.tick_count == 0
+        assert [p for p, _ in errors] == [bad]
 
     async def test_concurrent_with_slow_processor(
         self, concurrent_clock: BacktestClock
@@ -298,6 +344,37 @@ class TestPauseResumeDuringExecution:
             clock.resume_processor(p2)
             assert len(clock.get_active_processors()) == 3
 
+    async def test_active_processor_cache_tracks_changes(self) -> None:
+        """The cached active processor list should follow add/pause/remove."""
+        config = ClockConfig(
+            clock_mode=ClockMode.BACKTEST,
+            tick_size=1.0,
+            start_time=1000.0,
+            end_time=1010.0,
+        )
+        clock = BacktestClock(config)
+        p1 = MockProcessor("p1")
+        p2 = MockProcessor("p2")
+        clock.add_processor(p1)
+        assert clock._active_processors == []
+
+        async with clock:
+            assert clock._active_processors == [p1]
+
+            clock.add_processor(p2)
+            assert clock._active_processors == [p1, p2]
+
+            clock.pause_processor(p1)
+            assert clock._active_processors == [p2]
+
+            clock.resume_processor(p1)
+            assert clock._active_processors == [p1, p2]
+
+            clock.remove_processor(p2)
+            assert clock._active_processors == [p1]
+
+        assert clock._active_processors == []
+
 
 class TestConcurrentPauseResume:
     """Test pause/resume in concurrent execution mode."""
@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable
 
 import pytest
@@ -8,141 +9,133 @@ from chronopype.processors.base import TickProcessor
 from tests.conftest import MockProcessor
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_timeout(
-    clock_fixture: str,
-    request: pytest.FixtureRequest,
+    any_clock: BaseClock,
     mock_processor: MockProcessor,
     error_callback: Callable[[TickProcessor, Exception], None],
-    error_list: list[tuple[TickProcessor, Exception]],
+    error_list: deque[tuple[TickProcessor, Exception]],
 ) -> None:
     """Test processor timeout handling."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
-    clock._error_callback = error_callback
-    clock.add_processor(mock_processor)
-    mock_processor.sleep_time = clock.config.processor_timeout + 0.1
+    any_clock._error_callback = error_callback
+    any_clock.add_processor(mock_processor)
+    mock_processor.sleep_time = any_clock.config.processor_timeout + 0.1
 
-    async with clock:
+    async with any_clock:
         with pytest.raises(ProcessorTimeoutError):
-            await clock.run_til(clock.current_timestamp + 1)
+            await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert len(error_list) > 0
     assert isinstance(error_list[0][1], ProcessorTimeoutError)
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_timeout_with_retries(
-    clock_fixture: str,
-    request: pytest.FixtureRequest,
+    any_clock: BaseClock,
     mock_processor: MockProcessor,
     error_callback: Callable[[TickProcessor, Exception], None],
-    error_list: list[tuple[TickProcessor, Exception]],
+    error_list: deque[tuple[TickProcessor, Exception]],
 ) -> None:
     """Test processor timeout with retries."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
-    clock._error_callback = error_callback
-    clock.add_processor(mock_processor)
+    any_clock._error_callback = error_callback
+    any_clock.add_processor(mock_processor)
 
     # Make processor sleep longer than timeout but less than total retry time
     mock_processor.sleep_time = (
-        clock.config.processor_timeout * 0.6
+        any_clock.config.processor_timeout * 0.6
     )  # Should succeed after retries
 
-    async with clock:
-        await clock.run_til(clock.current_timestamp + 1)
+    async with any_clock:
+        await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert len(error_list) == 0
     assert mock_processor.tick_count >= 1
 
     # Now make it fail even with retries
-    mock_processor.sleep_time = clock.config.processor_timeout * 2
+    mock_processor.sleep_time = any_clock.config.processor_timeout * 2
 
-    async with clock:
+    async with any_clock:
         with pytest.raises(ProcessorTimeoutError):
-            await clock.run_til(clock.current_timestamp + 2)
+            await any_clock.run_til(any_clock.current_timestamp + 2)
 
     assert len(error_list) > 0
     assert isinstance(error_list[0][1], ProcessorTimeoutError)
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_error_handling(
-    clock_fixture: str,
-    request: pytest.FixtureRequest,
+    any_clock: BaseClock,
     mock_processor: MockProcessor,
     error_callback: Callable[[TickProcessor, Exception], None],
-    error_list: list[tuple[TickProcessor, Exception]],
+    error_list: deque[tuple[TickProcessor, Exception]],
 ) -> None:
     """Test error handling during processor execution."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
-    clock._error_callback = error_callback
-    clock.add_processor(mock_processor)
+    any_clock._error_callback = error_callback
+    any_clock.add_processor(mock_processor)
 
     # Make processor raise an error
     mock_processor.should_raise = True
 
-    async with clock:
+    async with any_clock:
         with pytest.raises(ValueError):
-            await clock.run_til(clock.current_timestamp + 1)
+            await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert len(error_list) > 0
     assert isinstance(error_list[0][1], ValueError)
 
-    state = clock.get_processor_state(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert state.error_count == 1
     assert state.last_error is not None
     assert state.last_error_time is not None
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
-async def test_concurrent_processor_errors(
-    clock_fixture: str, request: pytest.FixtureRequest
-) -> None:
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
+async def test_concurrent_processor_errors(any_clock: BaseClock) -> None:
     """Test error handling in concurrent mode."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
 
-    # Create a new config with concurrent_processors set to True
-    new_config = clock.config.model_copy(update={"concurrent_processors": True})
-    clock._config = new_config
+    # Without retries every processor fails on its first attempt, before the
+    # tick waits on any task, so all of them record their error
+    new_config = any_clock.config.model_copy(
+        update={"concurrent_processors": True, "max_retries": 0}
+    )
+    any_clock._config = new_config
 
     # Add multiple processors that will raise errors
     processors = [MockProcessor() for _ in range(3)]
     for processor in processors:
         processor.should_raise = True
-        clock.add_processor(processor)
+        any_clock.add_processor(processor)
 
-    async with clock:
+    async with any_clock:
         with pytest.raises(ValueError):
-            await clock.run_til(clock.current_timestamp + 1)
+            await any_clock.run_til(any_clock.current_timestamp + 1)
 
     # Check that all processors have error states
     for processor in processors:
-        state = clock.get_processor_state(processor)
+        state = any_clock.get_processor_state(processor)
         assert state is not None
         assert state.error_count == 1
         assert state.last_error is not None
         assert state.last_error_time is not None
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_execution_errors(
-    clock_fixture: str,
-    request: pytest.FixtureRequest,
+    any_clock: BaseClock,
     mock_processor: MockProcessor,
     error_callback: Callable[[TickProcessor, Exception], None],
-    error_list: list[tuple[TickProcessor, Exception]],
+    error_list: deque[tuple[TickProcessor, Exception]],
 ) -> None:
     """Test various error scenarios during processor execution."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
-    clock._error_callback = error_callback
-    clock.add_processor(mock_processor)
+    any_clock._error_callback = error_callback
+    any_clock.add_processor(mock_processor)
 
     # Test timeout error
-    mock_processor.sleep_time = clock.config.processor_timeout * 2
-    async with clock:
+    mock_processor.sleep_time = any_clock.config.processor_timeout * 2
+    async with any_clock:
         with pytest.raises(ProcessorTimeoutError):
-            await clock.run_til(clock.current_timestamp + 1)
+            await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert len(error_list) > 0
     assert isinstance(error_list[0][1], ProcessorTimeoutError)
@@ -152,9 +145,28 @@ async def test_processor_execution_errors(
     mock_processor.sleep_time = 0
     error_list.clear()  # Clear previous errors
 
-    async with clock:
+    async with any_clock:
         with pytest.raises(ValueError):
-            await clock.run_til(clock.current_timestamp + 1)
+            await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert len(error_list) > 0
     assert isinstance(error_list[-1][1], ValueError)
+
+
+async def test_error_updates_state_in_place(
+    clock: BaseClock, mock_processor: MockProcessor
+) -> None:
+    """Test that recording an error keeps the registered state object."""
+    clock.add_processor(mock_processor)
+    state = clock.get_processor_state(mock_processor)
+    mock_processor.should_raise = True
+
+    async with clock:
+        with pytest.raises(ValueError):
+            await clock.run_til(clock.current_timestamp + 1)
+
+    assert clock.get_processor_state(mock_processor) is state
+    assert state is not None
+    assert state.error_count == 1
+    assert state.last_error == "Test error"
+    assert state.model_dump(exclude_unset=True)["error_count"] == 1
@@ -142,6 +142,31 @@ class TestClockTickEvent:
         assert len(events) == 1
         assert len(events[0].processors) == 2
 
+    async def test_tick_event_excludes_paused_processors(
+        self, clock: BacktestClock
+    ) -> None:
+        events: list[ClockTickEvent] = []
+        p1 = MockProcessor("p1")
+        p2 = MockProcessor("p2")
+        clock.add_processor(p1)
+        clock.add_processor(p2)
+
+        def on_tick(event: ClockTickEvent) -> None:
+            events.append(event)
+
+        clock.add_subscriber_with_callback(
+            clock.tick_publication, on_tick, with_event_info=False
+        )
+
+        async with clock:
+            await clock.step()
+            clock.pause_processor(p2)
+            await clock.step()
+
+        assert events[0].processors == [p1, p2]
+        assert events[1].processors == [p1]
+        assert events[1].processors is not clock._active_processors
+
 
 class TestClockStopEvent:
     """Test that ClockStopEvent is emitted on shutdown."""
@@ -181,6 +206,9 @@ class TestClockStopEvent:
         event = events[0]
         assert event.total_ticks == 5
         assert processor in event.final_states
+        final_state = event.final_states[processor]
+        assert final_state is not clock.get_processor_state(processor)
+        assert final_state.execution_times is not processor.state.execution_times
 
     async def test_stop_event_on_empty_clock(self, clock: BacktestClock) -> None:
         """Stop event should fire even with no processors."""
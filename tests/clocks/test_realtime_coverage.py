@@ -10,6 +10,7 @@ from chronopype.clocks.config import ClockConfig
 from chronopype.clocks.modes import ClockMode
 from chronopype.clocks.realtime import RealtimeClock
 from chronopype.exceptions import ClockError
+from chronopype.processors.base import TickProcessor
 from tests.conftest import MockProcessor
 
 
@@ -81,7 +82,7 @@ async def test_run_til_already_running(realtime_clock: RealtimeClock) -> None:
 async def test_run_til_impl_not_running(realtime_clock: RealtimeClock) -> None:
     # _running is False by default
     with pytest.raises(ClockError, match="Clock must be started"):
-        await realtime_clock._run_til_impl(time.time() + 1.0, [])
+        await realtime_clock._run_til_impl(time.time() + 1.0)
 
 
 # Lines 96-97: CancelledError in _wait_next_tick
@@ -163,3 +164,30 @@ async def test_run_til_without_context(realtime_clock: RealtimeClock) -> None:
     """run_til() outside a context manager should raise ClockError."""
     with pytest.raises(ClockError, match="Clock must be started in a context"):
         await realtime_clock.run_til(time.time() + 1.0)
+
+
+async def test_run_til_start_failure_forgets_processor(
+    realtime_clock: RealtimeClock,
+) -> None:
+    """A processor failing to start in run_til() is fully unregistered."""
+
+    class FailingStartProcessor(TickProcessor):
+        def tick(self, timestamp: float) -> None:
+            pass
+
+    processor = FailingStartProcessor()
+    realtime_clock.add_processor(processor)
+    assert processor in realtime_clock._sync_processors
+
+    async with realtime_clock:
+        processor._state = processor.state.model_copy(update={"is_active": False})
+
+        def failing_start(timestamp: float) -> None:
+            raise RuntimeError("start failed")
+
+        processor.start = failing_start  # type: ignore[method-assign]
+        with pytest.raises(ClockError, match="Failed to start processor"):
+            await realtime_clock.run_til(realtime_clock.current_timestamp + 1)
+
+    assert processor not in realtime_clock.processors
+    assert processor not in realtime_clock._sync_processors
@@ -1,19 +1,65 @@
 import asyncio
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 
 import pytest
 
 from chronopype.clocks.backtest import BacktestClock
+from chronopype.clocks.base import BaseClock
 from chronopype.clocks.config import ClockConfig
 from chronopype.clocks.modes import ClockMode
 from chronopype.clocks.realtime import RealtimeClock
 from chronopype.processors.base import TickProcessor
 
 
+class VirtualTime:
+    """A virtual clock driving the running event loop and ``time.sleep``.
+
+    Virtual time only moves when advanced, so timers, timeouts and sleeps
+    complete without waiting for the wall clock. Code waiting on a timer must
+    therefore run in another task while the test calls ``advance``.
+    """
+
+    def __init__(self, start: float) -> None:
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += max(0.0, seconds)
+
+    async def advance(self, seconds: float, step: float = 0.01) -> None:
+        """Advance virtual time, running the loop callbacks due on the way."""
+        target = self.now + seconds
+        await self._settle()
+        while self.now < target:
+            self.now = min(self.now + step, target)
+            await self._settle()
+
+    @staticmethod
+    async def _settle() -> None:
+        """Let due timers fire and the tasks they wake up run."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
 class MockProcessor(TickProcessor):
     """A mock processor for testing."""
 
+    # TickProcessor has no __slots__, so instances keep a __dict__ for its
+    # attributes and for methods patched by tests
+    __slots__ = (
+        "_name",
+        "start_called",
+        "stop_called",
+        "tick_count",
+        "should_raise",
+        "sleep_time",
+        "last_timestamp",
+    )
+
     def __init__(self, name: str = "mock") -> None:
         super().__init__()
 
@@ -62,8 +108,17 @@ def mock_processor() -> MockProcessor:
 
 
 @pytest.fixture
+def t0() -> float:
+    """A fixed start timestamp for processors started outside a clock."""
+    return 1_000_000.0
+
+
+@pytest.fixture(scope="session")
 def clock_config() -> ClockConfig:
-    """Create a basic clock configuration for testing."""
+    """Create a basic clock configuration for testing.
+
+    ClockConfig is frozen, so a single validated instance is shared.
+    """
     return ClockConfig(
         clock_mode=ClockMode.BACKTEST,
         tick_size=1.0,
@@ -75,9 +130,12 @@ def clock_config() -> ClockConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def realtime_config() -> ClockConfig:
-    """Create a realtime clock configuration for testing."""
+    """Create a realtime clock configuration for testing.
+
+    ClockConfig is frozen, so a single validated instance is shared.
+    """
     return ClockConfig(
         clock_mode=ClockMode.REALTIME,
         tick_size=0.1,
@@ -100,21 +158,30 @@ def realtime_clock(realtime_config: ClockConfig) -> RealtimeClock:
 
 
 @pytest.fixture
-def error_list() -> list[tuple[TickProcessor, Exception]]:
-    """Create a list to collect error callbacks."""
-    return []
+def any_clock(request: pytest.FixtureRequest) -> BaseClock:
+    """Create the clock named by the indirect parameter, e.g. ``"clock"``."""
+    clock: BaseClock = request.getfixturevalue(request.param)
+    return clock
+
+
+@pytest.fixture
+def error_list() -> deque[tuple[TickProcessor, Exception]]:
+    """Create a deque to collect error callbacks."""
+    return deque()
 
 
 @pytest.fixture
 def error_callback(
-    error_list: list[tuple[TickProcessor, Exception]],
+    error_list: deque[tuple[TickProcessor, Exception]],
 ) -> Callable[[TickProcessor, Exception], None]:
-    """Create an error callback that collects errors in a list."""
-
-    def callback(processor: TickProcessor, error: Exception) -> None:
-        error_list.append((processor, error))
+    """Create an error callback that collects errors in a deque.
 
-    return callback
+    The clock passes the processor and error as two arguments, so the bound
+    ``append`` is wrapped to store them as one tuple.
+    """
+    return lambda processor, error, _append=error_list.append: _append(
+        (processor, error)
+    )
 
 
 @pytest.fixture
@@ -125,9 +192,33 @@ def failing_processor() -> MockProcessor:
     return processor
 
 
+@pytest.fixture(autouse=True)
+async def cancel_leftover_tasks() -> AsyncIterator[None]:
+    """Cancel tasks a test left running so they do not leak into the next test.
+
+    All tests share one session-scoped event loop.
+    """
+    before = asyncio.all_tasks()
+    yield
+    leftover = asyncio.all_tasks() - before - {asyncio.current_task()}
+    for task in leftover:
+        task.cancel()
+    await asyncio.gather(*leftover, return_exceptions=True)
+
+
+@pytest.fixture
+async def virtual_time(monkeypatch: pytest.MonkeyPatch) -> VirtualTime:
+    """Run the test on virtual time instead of the wall clock."""
+    loop = asyncio.get_running_loop()
+    clock = VirtualTime(loop.time())
+    monkeypatch.setattr(loop, "time", clock.time)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
 @pytest.fixture
-def slow_processor() -> MockProcessor:
-    """Create a processor that simulates slow processing."""
+def slow_processor(virtual_time: VirtualTime) -> MockProcessor:
+    """Create a processor that simulates slow processing on virtual time."""
     processor = MockProcessor("slow")
     processor.sleep_time = 0.2
     return processor
@@ -4,47 +4,45 @@ import pytest
 
 from chronopype.clocks.base import BaseClock
 from chronopype.exceptions import ClockError
-from tests.conftest import MockProcessor
+from tests.conftest import MockProcessor, VirtualTime
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 def test_add_remove_processor(
-    clock_fixture: str, request: pytest.FixtureRequest, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test adding and removing processors."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
 
     # Add processor
-    clock.add_processor(mock_processor)
-    assert mock_processor in clock.processors
-    assert len(clock.processors) == 1
+    any_clock.add_processor(mock_processor)
+    assert mock_processor in any_clock.processors
+    assert len(any_clock.processors) == 1
 
-    state = clock.get_processor_state(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert not state.is_active
 
     # Remove processor
-    clock.remove_processor(mock_processor)
-    assert mock_processor not in clock.processors
-    assert len(clock.processors) == 0
+    any_clock.remove_processor(mock_processor)
+    assert mock_processor not in any_clock.processors
+    assert len(any_clock.processors) == 0
 
     # Test duplicate add
-    clock.add_processor(mock_processor)
+    any_clock.add_processor(mock_processor)
     with pytest.raises(ClockError):
-        clock.add_processor(mock_processor)
+        any_clock.add_processor(mock_processor)
 
     # Test remove non-existent
-    clock.remove_processor(mock_processor)
+    any_clock.remove_processor(mock_processor)
     with pytest.raises(ClockError):
-        clock.remove_processor(mock_processor)
+        any_clock.remove_processor(mock_processor)
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_async_tick(
-    clock_fixture: str, request: pytest.FixtureRequest, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test processor with async_tick implementation."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
 
     class AsyncProcessor(MockProcessor):
         async def async_tick(self, timestamp: float) -> None:
@@ -52,77 +50,90 @@ async def test_processor_async_tick(
             await super().async_tick(timestamp)
 
     processor = AsyncProcessor("async")
-    clock.add_processor(processor)
+    any_clock.add_processor(processor)
 
-    async with clock:
-        await clock.run_til(clock.current_timestamp + 1)
+    async with any_clock:
+        await any_clock.run_til(any_clock.current_timestamp + 1)
 
     assert processor.tick_count >= 1
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 def test_processor_state_transitions(
-    clock_fixture: str, request: pytest.FixtureRequest, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test processor state transitions."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
-    clock.add_processor(mock_processor)
+    any_clock.add_processor(mock_processor)
 
     # Test initial state
-    state = clock.get_processor_state(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert not state.is_active
     assert state.retry_count == 0
 
     # Test state after pause/resume
-    clock.resume_processor(mock_processor)
-    state = clock.get_processor_state(mock_processor)
+    any_clock.resume_processor(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert state.is_active
 
-    clock.pause_processor(mock_processor)
-    state = clock.get_processor_state(mock_processor)
+    any_clock.pause_processor(mock_processor)
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert not state.is_active
 
     # Test idempotent operations
-    clock.pause_processor(mock_processor)  # Should not raise
-    clock.resume_processor(mock_processor)
-    clock.resume_processor(mock_processor)  # Should not raise
+    any_clock.pause_processor(mock_processor)  # Should not raise
+    any_clock.resume_processor(mock_processor)
+    any_clock.resume_processor(mock_processor)  # Should not raise
 
 
-@pytest.mark.parametrize("clock_fixture", ["clock", "realtime_clock"])
+@pytest.mark.parametrize("any_clock", ["clock", "realtime_clock"], indirect=True)
 async def test_processor_state_management(
-    clock_fixture: str, request: pytest.FixtureRequest, mock_processor: MockProcessor
+    any_clock: BaseClock, mock_processor: MockProcessor
 ) -> None:
     """Test processor state management edge cases."""
-    clock: BaseClock = request.getfixturevalue(clock_fixture)
 
     # Test adding duplicate processor
-    clock.add_processor(mock_processor)
+    any_clock.add_processor(mock_processor)
     with pytest.raises(ClockError):
-        clock.add_processor(mock_processor)
+        any_clock.add_processor(mock_processor)
 
     # Test removing non-existent processor
     other_processor = MockProcessor("other")
     with pytest.raises(ClockError):
-        clock.remove_processor(other_processor)
+        any_clock.remove_processor(other_processor)
 
     # Test pausing/resuming non-existent processor
     with pytest.raises(ClockError):
-        clock.pause_processor(other_processor)
+        any_clock.pause_processor(other_processor)
     with pytest.raises(ClockError):
-        clock.resume_processor(other_processor)
+        any_clock.resume_processor(other_processor)
 
     # Test idempotent pause/resume
-    clock.pause_processor(mock_processor)
-    clock.pause_processor(mock_processor)  # Should not raise
-    state = clock.get_processor_state(mock_processor)
+    any_clock.pause_processor(mock_processor)
+    any_clock.pause_processor(mock_processor)  # Should not raise
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert not state.is_active
 
-    clock.resume_processor(mock_processor)
-    clock.resume_processor(mock_processor)  # Should not raise
-    state = clock.get_processor_state(mock_processor)
+    any_clock.resume_processor(mock_processor)
+    any_clock.resume_processor(mock_processor)  # Should not raise
+    state = any_clock.get_processor_state(mock_processor)
     assert state is not None
     assert state.is_active
+
+
+async def test_slow_processor_on_virtual_time(
+    slow_processor: MockProcessor, virtual_time: VirtualTime
+) -> None:
+    """Test that slow processing advances virtual time instead of blocking."""
+    start = virtual_time.now
+    slow_processor.tick(1000.0)
+    assert slow_processor.tick_count == 1
+    assert virtual_time.now == start + slow_processor.sleep_time
+
+    task = asyncio.ensure_future(slow_processor.async_tick(1001.0))
+    await virtual_time.advance(slow_processor.sleep_time)
+    assert task.done()
+    assert slow_processor.tick_count == 2
@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import time
 
 import pytest
 
@@ -140,9 +139,9 @@ async def test_safe_stop_network_exception() -> None:
 
 
 # Lines 207-213: await_cleanup normal case
-async def test_await_cleanup_normal() -> None:
+async def test_await_cleanup_normal(t0: float) -> None:
     proc = MockNetworkProcessor()
-    proc.start(time.time())
+    proc.start(t0)
     await asyncio.sleep(0.05)
     proc.stop()
     await proc.await_cleanup(timeout=2.0)
@@ -219,10 +218,10 @@ def test_tick_processor_resume_noop() -> None:
 # --- network.py pause/resume ---
 
 
-async def test_network_processor_pause_cancels_loop() -> None:
+async def test_network_processor_pause_cancels_loop(t0: float) -> None:
     """pause() should cancel the background network check loop."""
     proc = MockNetworkProcessor()
-    proc.start(time.time())
+    proc.start(t0)
     await asyncio.sleep(0.01)
 
     assert proc._check_network_task is not None
@@ -230,10 +229,10 @@ async def test_network_processor_pause_cancels_loop() -> None:
     assert proc._check_network_task is None
 
 
-async def test_network_processor_resume_restarts_loop() -> None:
+async def test_network_processor_resume_restarts_loop(t0: float) -> None:
     """resume() should restart the background network check loop."""
     proc = MockNetworkProcessor()
-    proc.start(time.time())
+    proc.start(t0)
     await asyncio.sleep(0.01)
 
     proc.pause()
@@ -249,10 +248,10 @@ async def test_network_processor_resume_restarts_loop() -> None:
     await proc.await_cleanup(timeout=1.0)
 
 
-async def test_network_processor_resume_noop_when_inactive() -> None:
+async def test_network_processor_resume_noop_when_inactive(t0: float) -> None:
     """resume() should not restart loop if processor is inactive."""
     proc = MockNetworkProcessor()
-    proc.start(time.time())
+    proc.start(t0)
     await asyncio.sleep(0.01)
 
     proc.pause()
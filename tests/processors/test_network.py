@@ -1,15 +1,18 @@
 import asyncio
 import logging
-import time
 
 import pytest
 
 from chronopype.processors.network import NetworkProcessor, NetworkStatus
+from tests.conftest import VirtualTime
 
 
 class MockNetworkProcessor(NetworkProcessor):
     """A mock network processor for testing."""
 
+    # NetworkProcessor has no __slots__, so instances keep a __dict__
+    __slots__ = ("_check_network_calls", "_should_fail", "_should_timeout", "called")
+
     _logger = None  # Match the base class definition
 
     def __init__(self, stats_window_size: int = 100) -> None:
@@ -17,6 +20,8 @@ class MockNetworkProcessor(NetworkProcessor):
         self._check_network_calls = 0
         self._should_fail = False
         self._should_timeout = False
+        # Set once check_network has run, so tests need not sleep for it
+        self.called = asyncio.Event()
 
     @property
     def check_network_calls(self) -> int:
@@ -30,15 +35,18 @@ class MockNetworkProcessor(NetworkProcessor):
 
     async def check_network(self) -> NetworkStatus:
         self._check_network_calls += 1
-        if self._should_fail:
-            self._network_status = NetworkStatus.ERROR
-            raise RuntimeError("Test error")
-        if self._should_timeout:
-            # Set status to NOT_CONNECTED before timing out
-            self._network_status = NetworkStatus.NOT_CONNECTED
-            await asyncio.sleep(10)  # Force timeout
-            return NetworkStatus.NOT_CONNECTED
-        return NetworkStatus.CONNECTED
+        try:
+            if self._should_fail:
+                self._network_status = NetworkStatus.ERROR
+                raise RuntimeError("Test error")
+            if self._should_timeout:
+                # Set status to NOT_CONNECTED before timing out
+                self._network_status = NetworkStatus.NOT_CONNECTED
+                await asyncio.sleep(10)  # Force timeout
+                return NetworkStatus.NOT_CONNECTED
+            return NetworkStatus.CONNECTED
+        finally:
+            self.called.set()
 
 
 @pytest.fixture
@@ -46,13 +54,15 @@ def network_processor() -> MockNetworkProcessor:
     return MockNetworkProcessor()
 
 
+def _assert_status(processor: NetworkProcessor, expected: NetworkStatus) -> None:
+    assert processor.network_status is expected
+
+
 async def test_network_processor_initialization(
     network_processor: MockNetworkProcessor,
 ) -> None:
     """Test network processor initialization."""
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.STOPPED.value
+    _assert_status(network_processor, NetworkStatus.STOPPED)
     assert network_processor.check_network_interval == 10.0
     assert network_processor.check_network_timeout == 5.0
     assert network_processor.network_error_wait_time == 60.0
@@ -60,39 +70,33 @@ async def test_network_processor_initialization(
 
 async def test_network_processor_start_stop(
     network_processor: MockNetworkProcessor,
+    t0: float,
 ) -> None:
     """Test network processor start/stop."""
-    network_processor.start(time.time())
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.NOT_CONNECTED.value
+    network_processor.start(t0)
+    _assert_status(network_processor, NetworkStatus.NOT_CONNECTED)
 
     # Wait for first check
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(network_processor.called.wait(), timeout=1.0)
     assert network_processor.check_network_calls > 0
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.CONNECTED.value
+    _assert_status(network_processor, NetworkStatus.CONNECTED)
 
     network_processor.stop()
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.STOPPED.value
+    _assert_status(network_processor, NetworkStatus.STOPPED)
 
 
 async def test_network_processor_error_handling(
     network_processor: MockNetworkProcessor,
+    t0: float,
 ) -> None:
     """Test network processor error handling."""
     network_processor._should_fail = True
-    network_processor.start(time.time())
+    network_processor.start(t0)
 
     # Wait for error
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(network_processor.called.wait(), timeout=1.0)
     assert network_processor.check_network_calls > 0
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.ERROR.value
+    _assert_status(network_processor, NetworkStatus.ERROR)
 
     # Check error state
     state = network_processor.state
@@ -105,18 +109,18 @@ async def test_network_processor_error_handling(
 
 async def test_network_processor_timeout(
     network_processor: MockNetworkProcessor,
+    virtual_time: VirtualTime,
+    t0: float,
 ) -> None:
     """Test network processor timeout handling."""
     network_processor._should_timeout = True
     network_processor.check_network_timeout = 0.1  # Set short timeout
-    network_processor.start(time.time())
+    network_processor.start(t0)
 
     # Wait for timeout and state transition
-    await asyncio.sleep(0.3)  # Wait for the complete state transition
+    await virtual_time.advance(0.3)  # Wait for the complete state transition
     assert network_processor.check_network_calls > 0
-    status = network_processor.network_status
-    assert isinstance(status, NetworkStatus)
-    assert status.value == NetworkStatus.NOT_CONNECTED.value
+    _assert_status(network_processor, NetworkStatus.NOT_CONNECTED)
 
     # Check error state
     state = network_processor.state
@@ -129,17 +133,19 @@ async def test_network_processor_timeout(
 
 async def test_network_processor_backoff(
     network_processor: MockNetworkProcessor,
+    virtual_time: VirtualTime,
+    t0: float,
 ) -> None:
     """Test network processor backoff strategy."""
     network_processor._should_fail = True
-    network_processor.start(time.time())
+    network_processor.start(t0)
 
     # Wait for multiple retries
-    await asyncio.sleep(0.5)
+    await virtual_time.advance(0.5)
     initial_calls = network_processor.check_network_calls
 
     # Wait more to see if backoff is working
-    await asyncio.sleep(1)
+    await virtual_time.advance(1)
     later_calls = network_processor.check_network_calls
 
     # The rate of calls should decrease due to exponential backoff
@@ -1,17 +1,24 @@
+import statistics
 from datetime import datetime
+from math import isclose
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from chronopype.clocks.config import ClockConfig
 from chronopype.clocks.modes import ClockMode
 from chronopype.processors.models import ProcessorState
 
+# Adapters built once for the module; constructors are kept where the
+# validation error path itself is under test
+_CFG = TypeAdapter(ClockConfig)
+_PS = TypeAdapter(ProcessorState)
+
 
 def test_clock_config_validation() -> None:
     """Test ClockConfig validation."""
     # Test valid config
-    config = ClockConfig(clock_mode=ClockMode.BACKTEST)
+    config = _CFG.validate_python({"clock_mode": ClockMode.BACKTEST})
     assert config.tick_size == 1.0  # default value
     assert config.start_time == 0.0  # default value
     assert config.end_time == 0.0  # default value
@@ -33,7 +40,7 @@ def test_clock_config_validation() -> None:
 
 def test_clock_config_immutability() -> None:
     """Test that ClockConfig is immutable."""
-    config = ClockConfig(clock_mode=ClockMode.BACKTEST)
+    config = _CFG.validate_python({"clock_mode": ClockMode.BACKTEST})
 
     with pytest.raises(ValidationError) as exc_info:
         config.tick_size = 2.0
@@ -59,16 +66,18 @@ def test_processor_state_validation() -> None:
 
     # Test with values
     now = datetime.now()
-    state = ProcessorState(
-        last_timestamp=1000.0,
-        is_active=True,
-        retry_count=2,
-        error_count=1,
-        consecutive_errors=1,
-        max_consecutive_retries=2,
-        last_error="Test error",
-        last_error_time=now,
-        last_success_time=now,
+    state = _PS.validate_python(
+        {
+            "last_timestamp": 1000.0,
+            "is_active": True,
+            "retry_count": 2,
+            "error_count": 1,
+            "consecutive_errors": 1,
+            "max_consecutive_retries": 2,
+            "last_error": "Test error",
+            "last_error_time": now,
+            "last_success_time": now,
+        }
     )
     assert state.last_timestamp == 1000.0
     assert state.is_active
@@ -81,23 +90,24 @@ def test_processor_state_validation() -> None:
     assert state.last_success_time == now
 
 
-def test_processor_state_immutability() -> None:
-    """Test that ProcessorState is immutable."""
-    state = ProcessorState(last_timestamp=1000.0)
+def test_processor_state_mutability() -> None:
+    """Test that ProcessorState can be updated in place."""
+    state = _PS.validate_python({"last_timestamp": 1000.0})
 
-    with pytest.raises(ValidationError) as exc_info:
-        state.last_timestamp = 2000.0
-    assert "frozen_instance" in str(exc_info.value)
+    state.last_timestamp = 2000.0
+    state.is_active = True
+    assert state.last_timestamp == 2000.0
+    assert state.is_active
 
     # Test copy and update using model_copy
-    new_state = state.model_copy(update={"last_timestamp": 2000.0})
-    assert new_state.last_timestamp == 2000.0
-    assert state.last_timestamp == 1000.0  # Original unchanged
+    new_state = state.model_copy(update={"last_timestamp": 3000.0})
+    assert new_state.last_timestamp == 3000.0
+    assert state.last_timestamp == 2000.0  # Original unchanged
 
 
 def test_processor_state_execution_times() -> None:
     """Test execution times list in ProcessorState."""
-    state = ProcessorState(execution_times=[0.1, 0.2, 0.3])
+    state = _PS.validate_python({"execution_times": [0.1, 0.2, 0.3]})
     assert len(state.execution_times) == 3
     assert sum(state.execution_times) == 0.6
 
@@ -108,7 +118,7 @@ def test_processor_state_execution_times() -> None:
 
 def test_processor_state_statistics() -> None:
     """Test ProcessorState statistics calculations."""
-    state = ProcessorState(execution_times=[0.1, 0.2, 0.3, 0.4, 0.5])
+    state = _PS.validate_python({"execution_times": [0.1, 0.2, 0.3, 0.4, 0.5]})
 
     # Test basic statistics
     assert state.total_ticks == 5
@@ -117,7 +127,7 @@ def test_processor_state_statistics() -> None:
     assert state.total_execution_time == 1.5
     assert state.avg_execution_time == 0.3
     assert state.max_execution_time == 0.5
-    assert pytest.approx(state.std_dev_execution_time, 0.01) == 0.1581
+    assert isclose(state.std_dev_execution_time, 0.1581, abs_tol=1e-4)
     assert state.error_rate == 0.0
 
     # Test with errors
@@ -125,27 +135,48 @@ def test_processor_state_statistics() -> None:
     assert state.total_ticks == 6
     assert state.successful_ticks == 5
     assert state.failed_ticks == 1
-    assert state.error_rate == pytest.approx(16.67, 0.01)  # 1/6 * 100
+    assert isclose(state.error_rate, 100 / 6, rel_tol=1e-3)
+
+
+def test_processor_state_std_dev() -> None:
+    """Test the single-pass standard deviation against statistics.stdev."""
+    times = [0.013, 0.021, 0.008, 0.034, 0.017, 0.029]
+    state = _PS.validate_python({"execution_times": times})
+    assert isclose(state.std_dev_execution_time, statistics.stdev(times))
+
+    # Large offsets must not lose precision
+    shifted = [1e9 + t for t in times]
+    state = _PS.validate_python({"execution_times": shifted})
+    assert isclose(state.std_dev_execution_time, statistics.stdev(times), rel_tol=1e-4)
+
+    assert _PS.validate_python({"execution_times": [0.1]}).std_dev_execution_time == 0.0
+    assert ProcessorState().std_dev_execution_time == 0.0
 
 
 def test_processor_state_percentiles() -> None:
     """Test ProcessorState percentile calculations."""
-    state = ProcessorState(execution_times=[0.1, 0.2, 0.3, 0.4, 0.5])
+    state = _PS.validate_python({"execution_times": [0.1, 0.2, 0.3, 0.4, 0.5]})
 
     # Test various percentiles
-    assert state.get_execution_percentile(0) == 0.1
+    assert state.get_execution_percentiles([0, 25, 50, 75, 100]) == [
+        0.1,
+        0.2,
+        0.3,
+        0.4,
+        0.5,
+    ]
     assert state.get_execution_percentile(50) == 0.3
-    assert state.get_execution_percentile(100) == 0.5
-    assert state.get_execution_percentile(25) == 0.2
-    assert state.get_execution_percentile(75) == 0.4
+    assert state.get_execution_percentiles([]) == []
 
     # Test empty state
     empty_state = ProcessorState()
     assert empty_state.get_execution_percentile(50) == 0.0
+    assert empty_state.get_execution_percentiles([50, 95]) == [0.0, 0.0]
 
     # Test single value
-    single_state = ProcessorState(execution_times=[0.1])
+    single_state = _PS.validate_python({"execution_times": [0.1]})
     assert single_state.get_execution_percentile(50) == 0.1
+    assert single_state.get_execution_percentiles([5, 95]) == [0.1, 0.1]
 
 
 def test_processor_state_error_tracking() -> None:
@@ -170,6 +201,46 @@ def test_processor_state_error_tracking() -> None:
     assert state.last_success_time is not None
 
 
+def test_processor_state_in_place_updates() -> None:
+    """Test the in-place ProcessorState updates used by the clock."""
+    state = ProcessorState(execution_times=[1.0, 2.0])
+    execution_times = state.execution_times
+
+    state.apply_error(Exception("test"), 1000.0)
+    assert state.error_count == 1
+    assert state.consecutive_errors == 1
+    assert state.last_error == "test"
+
+    state.apply_execution_time(3.0, 2)
+    assert state.execution_times is execution_times
+    assert state.execution_times == [2.0, 3.0]
+    assert state.consecutive_errors == 0
+    assert state.last_success_time is not None
+
+
+def test_processor_state_update_does_not_mutate_original() -> None:
+    """Test that update_execution_time leaves the original state unchanged."""
+    state = ProcessorState(execution_times=[1.0])
+    new_state = state.update_execution_time(2.0, 10)
+    assert state.execution_times == [1.0]
+    assert new_state.execution_times == [1.0, 2.0]
+
+
+def test_processor_state_helpers_do_not_share_execution_times() -> None:
+    """Test that every returning helper copies the execution times."""
+    state = ProcessorState(execution_times=[1.0])
+    copies = [
+        state.record_error(Exception("test"), 1000.0),
+        state.reset_retries(),
+        state.update_retry_count(1),
+    ]
+
+    state.apply_execution_time(2.0, 10)
+
+    for copy in copies:
+        assert copy.execution_times == [1.0]
+
+
 def test_processor_state_retry_tracking() -> None:
     """Test ProcessorState retry tracking."""
     state = ProcessorState()
@@ -192,7 +263,7 @@ def test_processor_state_retry_tracking() -> None:
 
 def test_clock_config_defaults() -> None:
     """Test ClockConfig default values."""
-    config = ClockConfig(clock_mode=ClockMode.BACKTEST)
+    config = _CFG.validate_python({"clock_mode": ClockMode.BACKTEST})
 
     assert config.tick_size == 1.0
     assert config.start_time == 0.0